@@ -2,58 +2,119 @@
 Command-line interface for running QCrBox test suites.
 
 Usage:
-    python -m qcrbox_cmd_tester [--test-location DIR] [--qcrbox-url URL] [--debug]
+    python -m qcrbox_cmd_tester [--test-location DIR] [--qcrbox-url URL] [--debug] [--jobs N] [--case-jobs N] [--fail-fast]
 """
 
 import argparse
+import io
 import os
+import stat
 import sys
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from operator import attrgetter
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import yaml
-from pydantic import ValidationError
-from qcrboxapiclient.client import Client
 
 from .error_formatter import format_yaml_error
-from .models import TestSuite
-from .run_suite import TestSuiteResult, run_test_suite
+from .models import TestSuite, YamlLoader
 
+if TYPE_CHECKING:
+    # The API client and everything it pulls in is only imported once suites actually run
+    from .run_suite import TestSuiteResult
 
-def print_test_results(result: TestSuiteResult, debug_dir: Path | None = None) -> None:
-    """Print test results in a readable format."""
-    # Calculate statistics
-    total_test_cases = len(result.test_results)
-    passed_test_cases = sum(1 for tr in result.test_results if tr.all_passed)
-    total_expected_results = sum(len(tr.individual_results) for tr in result.test_results)
-    passed_expected_results = sum(sum(1 for ir in tr.individual_results if ir.passed) for tr in result.test_results)
+# Booleans sum as integers, so these count passes without a Python level loop body
+_get_all_passed = attrgetter("all_passed")
+_get_passed = attrgetter("passed")
+_get_yaml_file_name = attrgetter("yaml_file.name")
 
-    print(f"\n{'=' * 80}")
-    print(f"Test Suite: {result.application_slug}")
-    print(f"Status: {'✓ PASSED' if result.all_passed else '✗ FAILED'}")
-    print(f"Test Cases: {passed_test_cases}/{total_test_cases} passed")
-    print(f"Expected Results: {passed_expected_results}/{total_expected_results} passed")
-    print(f"{'=' * 80}\n")
+_YAML_SUFFIXES = (".yaml", ".yml")
+
+# Status strings indexed by a passed flag (False -> 0, True -> 1)
+_STATUS_SYMBOL = ("✗", "✓")
+_PASS_FAIL = ("FAILED", "PASSED")
+_STATUS_LABEL = ("✗ FAILED", "✓ PASSED")
+
+# Horizontal rules used to separate sections in the report and debug logs
+_HR = "=" * 80
+_HR_MINOR = "-" * 80
+
+_LOG_BUFFER_SIZE = 1 << 20
+
+# Default concurrency, kept low so that by default at most
+# DEFAULT_JOBS * DEFAULT_CASE_JOBS commands run against one QCrBox server at once.
+# Higher values are opt-in through --jobs and --case-jobs.
+DEFAULT_JOBS = 1
+DEFAULT_CASE_JOBS = 4
+
+# Characters replaced by underscores when building debug log file and directory names
+_SAFE_NAME_TABLE = str.maketrans({"/": "_", " ": "_"})
+
+
+def compute_result_stats(result: "TestSuiteResult") -> tuple[int, int, int, int]:
+    """
+    Count test cases and expected results of a suite in a single pass.
+
+    Returns:
+        Tuple of (total_test_cases, passed_test_cases, total_expected_results, passed_expected_results)
+    """
+    total_test_cases = passed_test_cases = total_expected_results = passed_expected_results = 0
+    for tr in result.test_results:
+        total_test_cases += 1
+        passed_test_cases += tr.all_passed
+        total_expected_results += len(tr.individual_results)
+        passed_expected_results += sum(map(_get_passed, tr.individual_results))
+    return total_test_cases, passed_test_cases, total_expected_results, passed_expected_results
+
+
+def print_test_results(
+    result: "TestSuiteResult", debug_dir: Path | None = None, stats: tuple[int, int, int, int] | None = None
+) -> None:
+    """
+    Print test results in a readable format.
+
+    Args:
+        result: Test suite result
+        debug_dir: Directory the debug logs for this suite were saved to, if any
+        stats: Precomputed counts from compute_result_stats, calculated here if not given
+    """
+    if stats is None:
+        stats = compute_result_stats(result)
+    total_test_cases, passed_test_cases, total_expected_results, passed_expected_results = stats
+
+    # Collect the report in memory and write it to stdout in one go
+    out = io.StringIO()
+    print(f"\n{_HR}", file=out)
+    print(f"Test Suite: {result.application_slug}", file=out)
+    print(f"Status: {_STATUS_LABEL[result.all_passed]}", file=out)
+    print(f"Test Cases: {passed_test_cases}/{total_test_cases} passed", file=out)
+    print(f"Expected Results: {passed_expected_results}/{total_expected_results} passed", file=out)
+    print(f"{_HR}\n", file=out)
 
     for test_result in result.test_results:
-        status_symbol = "✓" if test_result.all_passed else "✗"
-        print(f"{status_symbol} Test Case: {test_result.test_case_name}")
+        status_symbol = _STATUS_SYMBOL[test_result.all_passed]
+        skipped = " (skipped)" if test_result.command_status == "skipped" else ""
+        print(f"{status_symbol} Test Case: {test_result.test_case_name}{skipped}", file=out)
 
         for individual_result in test_result.individual_results:
             indent = "    "
             if individual_result.passed:
-                print(f"{indent}✓ {individual_result.test_case_name}")
+                print(f"{indent}✓ {individual_result.test_case_name}", file=out)
             else:
-                print(f"{indent}✗ {individual_result.test_case_name}")
+                print(f"{indent}✗ {individual_result.test_case_name}", file=out)
                 if individual_result.log:
-                    print(f"{indent}  Log: {individual_result.log}")
+                    print(f"{indent}  Log: {individual_result.log}", file=out)
                 if debug_dir:
-                    print(f"{indent}  Debug logs saved to: {debug_dir}")
-        print()
+                    print(f"{indent}  Debug logs saved to: {debug_dir}", file=out)
+        print(file=out)
+
+    sys.stdout.write(out.getvalue())
 
 
 def save_debug_logs(
-    result: TestSuiteResult, test_suite: TestSuite, debug_base_dir: Path, timestamp: str
+    result: "TestSuiteResult", test_suite: TestSuite, debug_base_dir: Path, timestamp: str
 ) -> Path | None:
     """
     Save debug logs and CIF files for failing tests.
@@ -73,56 +134,190 @@ def save_debug_logs(
     if not has_failures:
         return None
 
+    tests_by_name = {tc.name: tc for tc in test_suite.tests}
+
     # Create debug directory for this suite
-    safe_app_name = result.application_slug.replace("/", "_").replace(" ", "_")
+    safe_app_name = result.application_slug.translate(_SAFE_NAME_TABLE)
     suite_debug_dir = debug_base_dir / f"{timestamp}_{safe_app_name}"
     suite_debug_dir.mkdir(parents=True, exist_ok=True)
 
-    # Create summary log file
+    # Collect the summary log in a list and write it to disk in one go
     log_file = suite_debug_dir / "summary.log"
-    with open(log_file, "w") as f:
-        f.write(f"Test Suite: {result.application_slug}\n")
-        f.write(f"Timestamp: {timestamp}\n")
-        f.write(f"Status: {'PASSED' if result.all_passed else 'FAILED'}\n")
-        f.write("=" * 80 + "\n\n")
-
-        for test_result in result.test_results:
-            f.write(f"Test Case: {test_result.test_case_name}\n")
-            f.write(f"Status: {'PASSED' if test_result.all_passed else 'FAILED'}\n")
-
-            if not test_result.all_passed:
-                # Find the corresponding test case
-                test_case = next((tc for tc in test_suite.tests if tc.name == test_result.test_case_name), None)
-
-                if test_case:
-                    f.write(f"Command: {test_case.qcrbox_command_name}\n")
-                    f.write(
-                        f"Application: {test_case.qcrbox_application_slug} v{test_case.qcrbox_application_version}\n"
-                    )
-                    f.write(f"Command Status: {test_result.command_status}\n")
-
-                # Save CIF file if available
-                if test_result.result_cif:
-                    safe_test_name = test_result.test_case_name.replace("/", "_").replace(" ", "_")
-                    cif_file = suite_debug_dir / f"{safe_test_name}_result.cif"
-                    cif_file.write_text(test_result.result_cif)
-                    f.write(f"Result CIF saved to: {cif_file.name}\n")
-                elif test_result.command_status == "failed":
-                    f.write("No result CIF available (command failed)\n")
-
-                f.write("\nFailed Checks:\n")
-                for individual_result in test_result.individual_results:
-                    if not individual_result.passed:
-                        f.write(f"  - {individual_result.test_case_name}\n")
-                        if individual_result.log:
-                            f.write(f"    Log: {individual_result.log}\n")
-
-            f.write("\n" + "-" * 80 + "\n\n")
+    parts: list[str] = []
+    append = parts.append
+    append(f"Test Suite: {result.application_slug}\n")
+    append(f"Timestamp: {timestamp}\n")
+    append(f"Status: {_PASS_FAIL[result.all_passed]}\n")
+    append(f"{_HR}\n\n")
+
+    for test_result in result.test_results:
+        append(f"Test Case: {test_result.test_case_name}\n")
+        append(f"Status: {_PASS_FAIL[test_result.all_passed]}\n")
+
+        if not test_result.all_passed:
+            # Find the corresponding test case
+            test_case = tests_by_name.get(test_result.test_case_name)
+
+            if test_case:
+                append(f"Command: {test_case.qcrbox_command_name}\n")
+                append(f"Application: {test_case.qcrbox_application_slug} v{test_case.qcrbox_application_version}\n")
+                append(f"Command Status: {test_result.command_status}\n")
+
+            # Save CIF file if available
+            if test_result.result_cif:
+                safe_test_name = test_result.test_case_name.translate(_SAFE_NAME_TABLE)
+                cif_file = suite_debug_dir / f"{safe_test_name}_result.cif"
+                with open(cif_file, "wb", buffering=_LOG_BUFFER_SIZE) as cif:
+                    cif.write(test_result.result_cif.encode("utf-8"))
+                append(f"Result CIF saved to: {cif_file.name}\n")
+            elif test_result.command_status == "failed":
+                append("No result CIF available (command failed)\n")
+
+            append("\nFailed Checks:\n")
+            for individual_result in test_result.individual_results:
+                if not individual_result.passed:
+                    append(f"  - {individual_result.test_case_name}\n")
+                    if individual_result.log:
+                        append(f"    Log: {individual_result.log}\n")
+
+        append(f"\n{_HR_MINOR}\n\n")
+
+    with open(log_file, "w", buffering=_LOG_BUFFER_SIZE) as log:
+        log.write("".join(parts))
 
     return suite_debug_dir
 
 
-def run_test_suites_from_path(tests_path: Path, qcrbox_url: str, debug: bool = False) -> bool:
+@dataclass
+class SuiteRun:
+    """Outcome of loading and running a single YAML test suite file."""
+
+    yaml_file: Path
+    yaml_data: dict | None = None
+    test_suite: TestSuite | None = None
+    result: "TestSuiteResult | None" = None
+    error: Exception | None = None
+
+
+def load_suite(yaml_file: Path) -> SuiteRun:
+    """
+    Load and validate a YAML test suite file.
+
+    Args:
+        yaml_file: Path to the YAML test suite file
+
+    Returns:
+        SuiteRun with the parsed test suite, or with the error raised while loading
+    """
+    suite_run = SuiteRun(yaml_file=yaml_file)
+    try:
+        # Load YAML data first to have it available for error formatting
+        with open(yaml_file, "rb") as f:
+            suite_run.yaml_data = yaml.load(f, Loader=YamlLoader)
+        suite_run.test_suite = TestSuite.from_yaml_dict(suite_run.yaml_data, base_folder=yaml_file.parent)
+    except Exception as e:
+        suite_run.error = e
+    return suite_run
+
+
+def run_loaded_suite(
+    suite_run: SuiteRun, qcrbox_url: str, fail_fast: bool = False, case_jobs: int = DEFAULT_CASE_JOBS
+) -> SuiteRun:
+    """
+    Run a test suite returned by load_suite against QCrBox.
+
+    Each call creates its own client so that suites can run in separate
+    worker threads without sharing connection state. The client is used as a
+    context manager so its HTTP connections are reused across the suite and
+    closed afterwards.
+
+    Args:
+        suite_run: Loaded suite; returned unchanged if loading failed
+        qcrbox_url: URL of the QCrBox API
+        fail_fast: If True, stop the suite at its first failing test case
+        case_jobs: Number of test cases of the suite to run concurrently
+
+    Returns:
+        The same SuiteRun with either the result or the error raised while running
+    """
+    if suite_run.error is not None:
+        return suite_run
+
+    import httpx
+    from qcrboxapiclient.client import Client
+
+    from .run_suite import run_test_suite
+
+    try:
+        # Keep one keep-alive connection pool open for every request made by this suite
+        limits = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+        with Client(qcrbox_url, httpx_args={"limits": limits}) as client:
+            suite_run.result = run_test_suite(client, suite_run.test_suite, max_workers=case_jobs, fail_fast=fail_fast)
+    except Exception as e:
+        suite_run.error = e
+    return suite_run
+
+
+def report_suite_run(
+    suite_run: SuiteRun, debug_base_dir: Path | None = None, timestamp: str | None = None
+) -> tuple[int, int, int, int] | None:
+    """
+    Print the outcome of a finished suite run and save its debug logs.
+
+    Args:
+        suite_run: Suite returned by run_loaded_suite
+        debug_base_dir: Base directory for debug logs, None if debug mode is off
+        timestamp: Timestamp used in the debug log directory names
+
+    Returns:
+        The counts from compute_result_stats, or None if the suite could not be loaded or run
+    """
+    print(f"\nLoading test suite from: {suite_run.yaml_file.name}")
+
+    if suite_run.error is not None:
+        format_yaml_error(suite_run.error, suite_run.yaml_file, suite_run.yaml_data)
+        return None
+
+    print(f"  Application: {suite_run.test_suite.application_slug} v{suite_run.test_suite.application_version}")
+    print(f"  Tests: {len(suite_run.test_suite.tests)}")
+
+    debug_dir = None
+    if debug_base_dir and timestamp:
+        debug_dir = save_debug_logs(suite_run.result, suite_run.test_suite, debug_base_dir, timestamp)
+    stats = compute_result_stats(suite_run.result)
+    print_test_results(suite_run.result, debug_dir, stats)
+    return stats
+
+
+def _location_mode(path: Path) -> int:
+    """
+    Return the st_mode of a path from a single stat call, or 0 if it does not exist.
+
+    Raises:
+        OSError: If the path exists but cannot be accessed, e.g. PermissionError
+    """
+    try:
+        return path.stat().st_mode
+    except (FileNotFoundError, NotADirectoryError):
+        return 0
+
+
+def _cancel_running_commands() -> None:
+    """Cancel the QCrBox commands of running suites, if any suite got as far as importing the client."""
+    qcrbox_client = sys.modules.get(f"{__package__}.qcrbox_client")
+    if qcrbox_client is not None:
+        qcrbox_client.cancel_running_commands()
+
+
+def run_test_suites_from_path(
+    tests_path: Path,
+    qcrbox_url: str,
+    debug: bool = False,
+    jobs: int = DEFAULT_JOBS,
+    is_dir: bool | None = None,
+    fail_fast: bool = False,
+    case_jobs: int = DEFAULT_CASE_JOBS,
+) -> bool:
     """
     Run test suite(s) from the specified file or directory.
 
@@ -130,114 +325,114 @@ def run_test_suites_from_path(tests_path: Path, qcrbox_url: str, debug: bool = F
         tests_path: Path to a YAML test suite file or directory containing YAML test suite files
         qcrbox_url: URL of the QCrBox API
         debug: If True, save detailed debug logs for failing tests
+        jobs: Number of test suites to run concurrently
+        is_dir: Whether tests_path is a directory, if already known from a previous stat call
+        fail_fast: If True, stop each suite at its first failing test case
+        case_jobs: Number of test cases to run concurrently within each suite,
+            up to jobs * case_jobs commands can run against QCrBox at once
 
     Returns:
         True if all tests passed, False otherwise
     """
-    client = Client(qcrbox_url)
-
     # Set up debug directory if needed
     debug_base_dir = None
     timestamp = None
     if debug:
         debug_base_dir = Path("logs")
         debug_base_dir.mkdir(exist_ok=True)
+        from datetime import datetime
+
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
     # Determine if path is a file or directory
-    if tests_path.is_file():
+    if is_dir is None:
+        mode = _location_mode(tests_path)
+        if not stat.S_ISDIR(mode) and not stat.S_ISREG(mode):
+            print(f"Error: '{tests_path}' is neither a file nor a directory", file=sys.stderr)
+            return False
+        is_dir = stat.S_ISDIR(mode)
+
+    if not is_dir:
         # Single YAML file
-        if tests_path.suffix.lower() not in [".yaml", ".yml"]:
+        if tests_path.suffix.lower() not in _YAML_SUFFIXES:
             print(f"Error: '{tests_path}' is not a YAML file (.yaml or .yml)", file=sys.stderr)
             return False
         yaml_files = [tests_path]
-    elif tests_path.is_dir():
-        # Directory containing YAML files
-        yaml_files = list(tests_path.glob("*.yaml")) + list(tests_path.glob("*.yml"))
     else:
-        print(f"Error: '{tests_path}' is neither a file nor a directory", file=sys.stderr)
-        return False
+        # Directory containing YAML files
+        # Execution order does not matter, results are sorted by file name before reporting
+        with os.scandir(tests_path) as entries:
+            yaml_files = [
+                Path(entry.path) for entry in entries if entry.name.endswith(_YAML_SUFFIXES) and entry.is_file()
+            ]
 
     if not yaml_files:
         print(f"No YAML test files found in {tests_path}", file=sys.stderr)
         return False
 
-    if tests_path.is_file():
+    if not is_dir:
         print(f"Running test suite from: {tests_path.name}")
     else:
         print(f"Found {len(yaml_files)} test suite(s) in {tests_path}")
 
     all_passed = True
     results = []
-    test_suites = []
-
-    for yaml_file in sorted(yaml_files):
-        print(f"\nLoading test suite from: {yaml_file.name}")
-
-        # Load YAML data first to have it available for error formatting
-        yaml_data = None
-        try:
-            with open(yaml_file) as f:
-                yaml_data = yaml.safe_load(f)
-        except yaml.YAMLError as e:
-            format_yaml_error(e, yaml_file, yaml_data)
-            all_passed = False
-            continue
-        except (FileNotFoundError, PermissionError) as e:
-            format_yaml_error(e, yaml_file, yaml_data)
-            all_passed = False
-            continue
-
-        try:
-            test_suite = TestSuite.from_yaml_dict(yaml_data, base_folder=yaml_file.parent)
-            print(f"  Application: {test_suite.application_slug} v{test_suite.application_version}")
-            print(f"  Tests: {len(test_suite.tests)}")
-
-            result = run_test_suite(client, test_suite)
-            results.append(result)
-            test_suites.append(test_suite)
-
-            if not result.all_passed:
-                all_passed = False
-
-        except ValidationError as e:
-            format_yaml_error(e, yaml_file, yaml_data)
+    suite_stats = []
+
+    # Suites are independent and network bound, so run them concurrently. A
+    # separate loader thread parses the YAML files, so each suite is handed to
+    # the runners as soon as it is loaded and parsing overlaps with the suites
+    # already running.
+    loader = ThreadPoolExecutor(max_workers=1)
+    runner = ThreadPoolExecutor(max_workers=max(1, jobs))
+    try:
+        futures = [
+            runner.submit(run_loaded_suite, suite_run, qcrbox_url, fail_fast, case_jobs)
+            for suite_run in loader.map(load_suite, yaml_files)
+        ]
+        suite_runs = [future.result() for future in as_completed(futures)]
+    except KeyboardInterrupt:
+        # Do not wait for the running suites, stop their polling and drop the queued ones
+        _cancel_running_commands()
+        loader.shutdown(wait=False, cancel_futures=True)
+        runner.shutdown(wait=False, cancel_futures=True)
+        raise
+    loader.shutdown()
+    runner.shutdown()
+
+    # Report in file name order so the output does not depend on which suite finished first
+    for suite_run in sorted(suite_runs, key=_get_yaml_file_name):
+        stats = report_suite_run(suite_run, debug_base_dir, timestamp)
+        if stats is None:
             all_passed = False
             continue
-        except Exception as e:
-            format_yaml_error(e, yaml_file, yaml_data)
+        results.append(suite_run.result)
+        suite_stats.append(stats)
+        if not suite_run.result.all_passed:
             all_passed = False
-            continue
-
-    # Save debug logs and print detailed results
-    for result, test_suite in zip(results, test_suites, strict=True):
-        debug_dir = None
-        if debug and debug_base_dir and timestamp:
-            debug_dir = save_debug_logs(result, test_suite, debug_base_dir, timestamp)
-        print_test_results(result, debug_dir)
 
     # Print summary
-    print(f"\n{'=' * 80}")
-    print("SUMMARY")
-    print(f"{'=' * 80}")
+    out = io.StringIO()
+    print(f"\n{_HR}", file=out)
+    print("SUMMARY", file=out)
+    print(f"{_HR}", file=out)
 
     # Calculate totals
     total_suites = len(results)
-    passed_suites = sum(1 for r in results if r.all_passed)
-
-    total_test_cases = sum(len(r.test_results) for r in results)
-    passed_test_cases = sum(sum(1 for tr in r.test_results if tr.all_passed) for r in results)
-
-    total_expected_results = sum(sum(len(tr.individual_results) for tr in r.test_results) for r in results)
-    passed_expected_results = sum(
-        sum(sum(1 for ir in tr.individual_results if ir.passed) for tr in r.test_results) for r in results
-    )
-
-    print(f"Test Suites: {passed_suites}/{total_suites} passed")
-    print(f"Test Cases: {passed_test_cases}/{total_test_cases} passed")
-    print(f"Expected Results: {passed_expected_results}/{total_expected_results} passed")
-    print(f"Overall Status: {'✓ PASSED' if all_passed else '✗ FAILED'}")
-    print(f"{'=' * 80}\n")
+    passed_suites = sum(map(_get_all_passed, results))
+    total_test_cases = passed_test_cases = total_expected_results = passed_expected_results = 0
+    for suite_total_tests, suite_passed_tests, suite_total_results, suite_passed_results in suite_stats:
+        total_test_cases += suite_total_tests
+        passed_test_cases += suite_passed_tests
+        total_expected_results += suite_total_results
+        passed_expected_results += suite_passed_results
+
+    print(f"Test Suites: {passed_suites}/{total_suites} passed", file=out)
+    print(f"Test Cases: {passed_test_cases}/{total_test_cases} passed", file=out)
+    print(f"Expected Results: {passed_expected_results}/{total_expected_results} passed", file=out)
+    print(f"Overall Status: {_STATUS_LABEL[all_passed]}", file=out)
+    print(f"{_HR}\n", file=out)
+    sys.stdout.write(out.getvalue())
 
     return all_passed
 
@@ -283,20 +478,60 @@ Examples:
         help="Enable debug mode: save detailed logs and CIF files for failing tests to ./logs directory",
     )
 
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=DEFAULT_JOBS,
+        help=(
+            f"Number of test suites to run concurrently (default: {DEFAULT_JOBS}). "
+            "Multiplies with --case-jobs: up to jobs x case-jobs commands run against QCrBox at once"
+        ),
+    )
+
+    parser.add_argument(
+        "--case-jobs",
+        type=int,
+        default=DEFAULT_CASE_JOBS,
+        help=(
+            f"Number of test cases to run concurrently within each suite (default: {DEFAULT_CASE_JOBS}). "
+            "Multiplies with --jobs: up to jobs x case-jobs commands run against QCrBox at once"
+        ),
+    )
+
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop each test suite at its first failing test case and mark the remaining ones as skipped",
+    )
+
     args = parser.parse_args()
 
-    # Validate tests path
-    if not args.test_location.exists():
+    # Validate tests path with a single stat call
+    try:
+        mode = _location_mode(args.test_location)
+    except OSError as e:
+        print(f"Error: Cannot access '{args.test_location}': {e.strerror or e}", file=sys.stderr)
+        return 1
+    if not mode:
         print(f"Error: Path '{args.test_location}' does not exist", file=sys.stderr)
         return 1
 
-    if not args.test_location.is_file() and not args.test_location.is_dir():
+    is_dir = stat.S_ISDIR(mode)
+    if not is_dir and not stat.S_ISREG(mode):
         print(f"Error: '{args.test_location}' is not a file or directory", file=sys.stderr)
         return 1
 
     # Run tests
     try:
-        all_passed = run_test_suites_from_path(args.test_location, args.qcrbox_url, args.debug)
+        all_passed = run_test_suites_from_path(
+            args.test_location,
+            args.qcrbox_url,
+            args.debug,
+            args.jobs,
+            is_dir=is_dir,
+            fail_fast=args.fail_fast,
+            case_jobs=args.case_jobs,
+        )
         return 0 if all_passed else 1
     except KeyboardInterrupt:
         print("\n\nTest run interrupted by user", file=sys.stderr)
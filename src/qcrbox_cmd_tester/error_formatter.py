@@ -5,14 +5,56 @@ Provides human-readable error messages with rich formatting for YAML parsing
 and validation errors, including context about test cases and expected results.
 """
 
+from collections.abc import Sequence
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import yaml
 from pydantic import ValidationError
-from rich.console import Console
-from rich.panel import Panel
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# rich is only imported once an error actually has to be shown, see _get_console
+console: "Console | None" = None
+
+# Discriminator values of the expected result models, used to interpret error locations
+_RESULT_TYPES = frozenset({"status", "cif_value", "cif_loop_value"})
+_CIF_RESULT_TYPES = frozenset({"cif_value", "cif_loop_value"})
+_TEST_TYPES = frozenset({"match", "non-match", "within", "contain", "missing", "present"})
+
+# Panel bodies, filled in with str.format
+_SYNTAX_PANEL_TMPL = (
+    "[red bold]YAML Parsing Error[/red bold]\n\n"
+    "Failed to parse YAML file: [cyan]{file}[/cyan]\n\n"
+    "[yellow]Error details:[/yellow]\n{err}"
+)
+_FILE_NOT_FOUND_PANEL_TMPL = (
+    "[red bold]File Not Found[/red bold]\n\n"
+    "Could not find file: [cyan]{file}[/cyan]\n\n"
+    "Please check that the file path is correct."
+)
+_PERMISSION_PANEL_TMPL = (
+    "[red bold]Permission Denied[/red bold]\n\nCannot read file: [cyan]{file}[/cyan]\n\nPlease check file permissions."
+)
+_GENERIC_PANEL_TMPL = (
+    "[red bold]Error Loading Test Suite[/red bold]\n\nFile: [cyan]{file}[/cyan]\n\n[yellow]Error:[/yellow] {err}"
+)
+_VALIDATION_PANEL_TMPL = (
+    "[red bold]YAML Validation Error[/red bold]\n\n"
+    "The YAML file [cyan]{file}[/cyan] has {count} validation {errors}.\n"
+    "Please check that your YAML structure matches the expected format."
+)
+
+
+def _get_console() -> "Console":
+    """Return the shared rich Console, creating it on first use."""
+    global console
+    if console is None:
+        from rich.console import Console
+
+        console = Console()
+    return console
 
 
 def format_yaml_error(error: Exception, yaml_file: Path, yaml_data: dict | None = None) -> None:
@@ -24,6 +66,7 @@ def format_yaml_error(error: Exception, yaml_file: Path, yaml_data: dict | None
         yaml_file: Path to the YAML file that caused the error
         yaml_data: Parsed YAML data (if available) for context in validation errors
     """
+    console = _get_console()
     console.print()
 
     if isinstance(error, yaml.YAMLError):
@@ -40,13 +83,23 @@ def format_yaml_error(error: Exception, yaml_file: Path, yaml_data: dict | None
     console.print()
 
 
+def _print_plain_error(console: "Console", message: str) -> None:
+    """Print a one line error without a Panel, used when the output is not a terminal (e.g. CI logs)."""
+    console.print(f"ERROR: {message}", markup=False, highlight=False)
+
+
 def _format_yaml_syntax_error(error: yaml.YAMLError, yaml_file: Path) -> None:
     """Format YAML parsing/syntax errors."""
+    console = _get_console()
+    if not console.is_terminal:
+        _print_plain_error(console, f"Invalid YAML syntax in {yaml_file}: {error}")
+        return
+
+    from rich.panel import Panel
+
     console.print(
         Panel(
-            f"[red bold]YAML Parsing Error[/red bold]\n\n"
-            f"Failed to parse YAML file: [cyan]{yaml_file}[/cyan]\n\n"
-            f"[yellow]Error details:[/yellow]\n{str(error)}",
+            _SYNTAX_PANEL_TMPL.format(file=yaml_file, err=error),
             title="❌ Invalid YAML Syntax",
             border_style="red",
         )
@@ -55,11 +108,16 @@ def _format_yaml_syntax_error(error: yaml.YAMLError, yaml_file: Path) -> None:
 
 def _format_file_not_found_error(yaml_file: Path) -> None:
     """Format file not found errors."""
+    console = _get_console()
+    if not console.is_terminal:
+        _print_plain_error(console, f"File not found: {yaml_file}")
+        return
+
+    from rich.panel import Panel
+
     console.print(
         Panel(
-            f"[red bold]File Not Found[/red bold]\n\n"
-            f"Could not find file: [cyan]{yaml_file}[/cyan]\n\n"
-            f"Please check that the file path is correct.",
+            _FILE_NOT_FOUND_PANEL_TMPL.format(file=yaml_file),
             title="❌ File Not Found",
             border_style="red",
         )
@@ -68,11 +126,16 @@ def _format_file_not_found_error(yaml_file: Path) -> None:
 
 def _format_permission_error(yaml_file: Path) -> None:
     """Format permission denied errors."""
+    console = _get_console()
+    if not console.is_terminal:
+        _print_plain_error(console, f"Permission denied: {yaml_file}")
+        return
+
+    from rich.panel import Panel
+
     console.print(
         Panel(
-            f"[red bold]Permission Denied[/red bold]\n\n"
-            f"Cannot read file: [cyan]{yaml_file}[/cyan]\n\n"
-            f"Please check file permissions.",
+            _PERMISSION_PANEL_TMPL.format(file=yaml_file),
             title="❌ Permission Error",
             border_style="red",
         )
@@ -81,11 +144,16 @@ def _format_permission_error(yaml_file: Path) -> None:
 
 def _format_generic_error(error: Exception, yaml_file: Path) -> None:
     """Format generic/unexpected errors."""
+    console = _get_console()
+    if not console.is_terminal:
+        _print_plain_error(console, f"Error loading test suite {yaml_file}: {error}")
+        return
+
+    from rich.panel import Panel
+
     console.print(
         Panel(
-            f"[red bold]Error Loading Test Suite[/red bold]\n\n"
-            f"File: [cyan]{yaml_file}[/cyan]\n\n"
-            f"[yellow]Error:[/yellow] {str(error)}",
+            _GENERIC_PANEL_TMPL.format(file=yaml_file, err=error),
             title="❌ Unexpected Error",
             border_style="red",
         )
@@ -101,40 +169,51 @@ def _format_validation_error(error: ValidationError, yaml_file: Path, yaml_data:
         yaml_file: Path to the YAML file
         yaml_data: Parsed YAML data for extracting test case names
     """
+    from rich.panel import Panel
+
+    console = _get_console()
+    errors = error.errors()
     error_count = error.error_count()
     error_s = "error" if error_count == 1 else "errors"
 
     console.print(
         Panel(
-            f"[red bold]YAML Validation Error[/red bold]\n\n"
-            f"The YAML file [cyan]{yaml_file.name}[/cyan] has {error_count} validation {error_s}.\n"
-            f"Please check that your YAML structure matches the expected format.",
+            _VALIDATION_PANEL_TMPL.format(file=yaml_file.name, count=error_count, errors=error_s),
             title=f"❌ {error_count} Validation {error_s.title()} Found",
             border_style="red",
         )
     )
 
-    # Display each validation error
-    for i, err in enumerate(error.errors(), 1):
-        location = _build_readable_location(err["loc"], yaml_data)
+    # Expected result lookup tables per test case position, shared by all errors
+    results_indexes: dict[int, dict] = {}
+
+    # Collect the details of every validation error and print them in one go
+    lines = []
+    for i, err in enumerate(errors, 1):
+        location = _build_readable_location(err["loc"], yaml_data, results_indexes)
         msg = err["msg"]
         error_type = err["type"]
 
-        console.print(f"\n[bold]Error {i}:[/bold]")
-        console.print(f"  [cyan]Location:[/cyan] {location}")
-        console.print(f"  [yellow]Message:[/yellow] {msg}")
-        console.print(f"  [dim]Type: {error_type}[/dim]")
+        lines.append(f"\n[bold]Error {i}:[/bold]")
+        lines.append(f"  [cyan]Location:[/cyan] {location}")
+        lines.append(f"  [yellow]Message:[/yellow] {msg}")
+        lines.append(f"  [dim]Type: {error_type}[/dim]")
 
         # Show the input value if available and not too large
         if "input" in err and err["input"] is not None:
             input_str = str(err["input"])
             if len(input_str) < 100:
-                console.print(f"  [magenta]Input:[/magenta] {input_str}")
+                lines.append(f"  [magenta]Input:[/magenta] {input_str}")
+
+    if lines:
+        console.print("\n".join(lines))
 
     console.print("\n[dim]For more information on the YAML format, see the documentation.[/dim]")
 
 
-def _build_readable_location(location_tuple: tuple, yaml_data: dict | None) -> str:
+def _build_readable_location(
+    location_tuple: tuple, yaml_data: dict | None, results_indexes: dict[int, dict] | None = None
+) -> str:
     """
     Build a human-readable location string from Pydantic's error location tuple.
 
@@ -144,78 +223,121 @@ def _build_readable_location(location_tuple: tuple, yaml_data: dict | None) -> s
     Args:
         location_tuple: Pydantic's error location tuple
         yaml_data: Parsed YAML data for context
+        results_indexes: Cache of _index_expected_results tables by test case position,
+            filled on demand and meant to be shared across the errors of one file
 
     Returns:
         Human-readable location string
     """
-    location_parts = [str(loc) for loc in location_tuple]
-    readable_location = []
-    test_cases = yaml_data.get("test_cases", []) if yaml_data else []
+    # Model level errors have no location and top level field errors a single field name,
+    # neither needs the test case context. A lone int is still resolved to its test case.
+    if not location_tuple:
+        return "<root>"
+    if len(location_tuple) == 1 and not isinstance(location_tuple[0], int):
+        return str(location_tuple[0])
+
+    # Pydantic locations hold list indexes as ints and field names as strs,
+    # so the parts are used as they are and only stringified for the output
+    walk = _LocationWalk(location_tuple, yaml_data.get("test_cases", []) if yaml_data else [], results_indexes)
 
     idx = 0
-    current_test_case = None
-
-    while idx < len(location_parts):
-        part = location_parts[idx]
-
-        # Check if this is a numeric index at the start
-        if idx == 0 and part.isdigit():
-            num_idx = int(part)
-
-            # Determine if this is a test_cases index or expected_results index
-            # by looking ahead for discriminator keywords
-            has_discriminator = _has_result_type_discriminator(location_parts, idx + 1)
-
-            if has_discriminator:
-                # This is an expected_results index
-                test_case_info = _format_test_case_context(test_cases)
-                if test_case_info:
-                    readable_location.append(test_case_info)
-                    current_test_case = test_cases[0] if test_cases else None
-
-                # Format the expected result info
-                result_info = _format_expected_result(location_parts, idx, current_test_case)
-                readable_location.append(result_info["text"])
-                idx = result_info["next_idx"]
-                continue
-            else:
-                # This is a test_cases index
-                test_case_info = _format_test_case_by_index(test_cases, num_idx)
-                if test_case_info:
-                    readable_location.append(test_case_info)
-                    current_test_case = test_cases[num_idx] if num_idx < len(test_cases) else None
-                idx += 1
-                continue
-
-        # Handle discriminator values that appear after test case
-        if _is_result_type_discriminator(part) and current_test_case:
-            result_info = _format_expected_result_from_discriminator(location_parts, idx, current_test_case)
-            readable_location.append(result_info["text"])
-            idx = result_info["next_idx"]
-            continue
+    while idx < len(location_tuple):
+        part = location_tuple[idx]
+        kind = "int" if isinstance(part, int) else "restype" if _is_result_type_discriminator(part) else "other"
+        idx = _LOCATION_TRANSITIONS.get((walk.state, kind), _append_plain_part)(walk, idx)
+
+    return " → ".join(walk.readable_location)
+
+
+class _LocationWalk:
+    """Mutable state shared by the _build_readable_location transition handlers."""
+
+    __slots__ = ("parts", "test_cases", "results_indexes", "readable_location", "state", "test_case", "test_case_idx")
+
+    def __init__(self, parts: Sequence[str | int], test_cases: list, results_indexes: dict[int, dict] | None):
+        self.parts = parts
+        self.test_cases = test_cases
+        self.results_indexes = {} if results_indexes is None else results_indexes
+        self.readable_location: list[str] = []
+        self.state = _LOC_TOP
+        self.test_case = None
+        self.test_case_idx = None
+
+    def enter_test_case(self, index: int) -> None:
+        """Make the test case at index the context for following discriminators."""
+        self.test_case = self.test_cases[index] if index < len(self.test_cases) else None
+        self.test_case_idx = index
+        self.state = _LOC_IN_TEST_CASE if self.test_case else _LOC_PLAIN
+
+
+def _append_plain_part(walk: _LocationWalk, idx: int) -> int:
+    """Add a location part as-is."""
+    walk.readable_location.append(str(walk.parts[idx]))
+    if walk.state == _LOC_TOP:
+        walk.state = _LOC_PLAIN
+    return idx + 1
+
+
+def _enter_top_level_index(walk: _LocationWalk, idx: int) -> int:
+    """Handle a leading numeric index, which is either a test case or an expected result."""
+    num_idx = walk.parts[idx]
+
+    if _has_result_type_discriminator(walk.parts, idx + 1):
+        # Expected results index of a single test case file
+        test_case_info = _format_test_case_context(walk.test_cases)
+        if test_case_info:
+            walk.readable_location.append(test_case_info)
+            walk.enter_test_case(0)
+        else:
+            walk.state = _LOC_PLAIN
+        result_info = _format_expected_result(walk.parts, idx, walk.test_case)
+        walk.readable_location.append(result_info["text"])
+        return result_info["next_idx"]
+
+    test_case_info = _format_test_case_by_index(walk.test_cases, num_idx)
+    if test_case_info:
+        walk.readable_location.append(test_case_info)
+        walk.enter_test_case(num_idx)
+    else:
+        walk.state = _LOC_PLAIN
+    return idx + 1
+
+
+def _enter_result_discriminator(walk: _LocationWalk, idx: int) -> int:
+    """Handle a result_type discriminator that follows a known test case."""
+    if walk.test_case_idx not in walk.results_indexes:
+        walk.results_indexes[walk.test_case_idx] = _index_expected_results(walk.test_case)
+    result_info = _format_expected_result_from_discriminator(
+        walk.parts, idx, walk.test_case, walk.results_indexes[walk.test_case_idx]
+    )
+    walk.readable_location.append(result_info["text"])
+    return result_info["next_idx"]
 
-        # For other parts, just add them as-is
-        readable_location.append(part)
-        idx += 1
 
-    return " → ".join(readable_location)
+_LOC_TOP, _LOC_IN_TEST_CASE, _LOC_PLAIN = range(3)
 
+# (state, part kind) -> handler; every other combination falls back to _append_plain_part
+_LOCATION_TRANSITIONS = {
+    (_LOC_TOP, "int"): _enter_top_level_index,
+    (_LOC_IN_TEST_CASE, "restype"): _enter_result_discriminator,
+}
 
-def _has_result_type_discriminator(location_parts: list[str], idx: int) -> bool:
+
+def _has_result_type_discriminator(location_parts: Sequence[str | int], idx: int) -> bool:
     """Check if the location at idx contains a result_type discriminator."""
     if idx >= len(location_parts):
         return False
-    return location_parts[idx] in ["status", "cif_value", "cif_loop_value"]
+    return _is_result_type_discriminator(location_parts[idx])
 
 
-def _is_result_type_discriminator(part: str) -> bool:
+def _is_result_type_discriminator(part: str | int) -> bool:
     """Check if a part is a result_type discriminator."""
-    return part in ["status", "cif_value", "cif_loop_value"]
+    return part in _RESULT_TYPES
 
 
-def _is_test_type_discriminator(part: str) -> bool:
+def _is_test_type_discriminator(part: str | int) -> bool:
     """Check if a part is a test_type discriminator."""
-    return part in ["match", "non-match", "within", "contain", "missing", "present"]
+    return part in _TEST_TYPES
 
 
 def _format_test_case_context(test_cases: list) -> str | None:
@@ -231,9 +353,7 @@ def _format_test_case_context(test_cases: list) -> str | None:
     if not test_cases:
         return None
 
-    test_case = test_cases[0]
-    test_name = test_case.get("name", "test_0") if isinstance(test_case, dict) else "test_0"
-    return f"Test case 0: {test_name}"
+    return f"Test case 0: {_test_case_name(test_cases[0], 0)}"
 
 
 def _format_test_case_by_index(test_cases: list, index: int) -> str | None:
@@ -250,12 +370,20 @@ def _format_test_case_by_index(test_cases: list, index: int) -> str | None:
     if index >= len(test_cases):
         return None
 
-    test_case = test_cases[index]
-    test_name = test_case.get("name", f"test_{index}") if isinstance(test_case, dict) else f"test_{index}"
-    return f"Test case {index}: {test_name}"
+    return f"Test case {index}: {_test_case_name(test_cases[index], index)}"
+
+
+def _test_case_name(test_case: dict, index: int) -> str:
+    """Return the name of a raw YAML test case, falling back to test_<index>."""
+    try:
+        name = test_case.get("name")
+    except AttributeError:
+        # Malformed YAML where the test case is not a mapping
+        name = None
+    return name or f"test_{index}"
 
 
-def _format_expected_result(location_parts: list[str], idx: int, test_case: dict | None) -> dict:
+def _format_expected_result(location_parts: Sequence[str | int], idx: int, test_case: dict | None) -> dict:
     """
     Format expected result information from location parts.
 
@@ -272,7 +400,7 @@ def _format_expected_result(location_parts: list[str], idx: int, test_case: dict
     test_type = None
 
     # Check for test_type (for cif_value and cif_loop_value)
-    if idx + 2 < len(location_parts) and result_type in ["cif_value", "cif_loop_value"]:
+    if idx + 2 < len(location_parts) and result_type in _CIF_RESULT_TYPES:
         potential_test_type = location_parts[idx + 2]
         if _is_test_type_discriminator(potential_test_type):
             test_type = potential_test_type
@@ -284,7 +412,9 @@ def _format_expected_result(location_parts: list[str], idx: int, test_case: dict
     return {"text": text, "next_idx": idx + 2}
 
 
-def _format_expected_result_from_discriminator(location_parts: list[str], idx: int, test_case: dict) -> dict:
+def _format_expected_result_from_discriminator(
+    location_parts: Sequence[str | int], idx: int, test_case: dict, results_index: dict | None = None
+) -> dict:
     """
     Format expected result when starting from a discriminator value.
 
@@ -292,6 +422,7 @@ def _format_expected_result_from_discriminator(location_parts: list[str], idx: i
         location_parts: List of location parts from Pydantic error
         idx: Current index in location_parts (should be the discriminator)
         test_case: Current test case dictionary for finding result index
+        results_index: Precomputed _index_expected_results table for test_case
 
     Returns:
         Dictionary with 'text' (formatted string) and 'next_idx' (next index to process)
@@ -301,12 +432,12 @@ def _format_expected_result_from_discriminator(location_parts: list[str], idx: i
     result_index = None
 
     # Check for test_type
-    if idx + 1 < len(location_parts) and result_type in ["cif_value", "cif_loop_value"]:
+    if idx + 1 < len(location_parts) and result_type in _CIF_RESULT_TYPES:
         potential_test_type = location_parts[idx + 1]
         if _is_test_type_discriminator(potential_test_type):
             test_type = potential_test_type
             # Find index in expected_results
-            result_index = _find_result_index(test_case, result_type, test_type)
+            result_index = _find_result_index(test_case, result_type, test_type, results_index)
             if result_index is not None:
                 text = f"expected value {result_index}: {result_type}({test_type})"
             else:
@@ -314,7 +445,7 @@ def _format_expected_result_from_discriminator(location_parts: list[str], idx: i
             return {"text": text, "next_idx": idx + 2}
 
     # Status or no test_type - find the result index
-    result_index = _find_result_index(test_case, result_type, None)
+    result_index = _find_result_index(test_case, result_type, None, results_index)
     if result_index is not None:
         text = f"expected value {result_index}: {result_type}"
     else:
@@ -322,7 +453,37 @@ def _format_expected_result_from_discriminator(location_parts: list[str], idx: i
     return {"text": text, "next_idx": idx + 1}
 
 
-def _find_result_index(test_case: dict, result_type: str, test_type: str | None) -> int | None:
+def _index_expected_results(test_case: dict) -> dict[tuple[str, str | None], int]:
+    """
+    Map result types to the index of the first matching expected result.
+
+    Each result is registered under (result_type, test_type) and, for lookups
+    that do not care about the test type, under (result_type, None).
+
+    Args:
+        test_case: Test case dictionary
+
+    Returns:
+        Dictionary from (result_type, test_type or None) to the first matching index
+    """
+    index = {}
+    for idx, res in enumerate(test_case.get("expected_results", [])):
+        if not isinstance(res, dict):
+            continue
+        result_type = res.get("result_type")
+        # Malformed YAML may hold lists or mappings here, which can never match anyway
+        if not isinstance(result_type, str):
+            continue
+        index.setdefault((result_type, None), idx)
+        test_type = res.get("test_type")
+        if isinstance(test_type, str):
+            index.setdefault((result_type, test_type), idx)
+    return index
+
+
+def _find_result_index(
+    test_case: dict, result_type: str, test_type: str | None, results_index: dict | None = None
+) -> int | None:
     """
     Find the index of an expected result matching the given types.
 
@@ -330,17 +491,11 @@ def _find_result_index(test_case: dict, result_type: str, test_type: str | None)
         test_case: Test case dictionary
         result_type: Result type to match (status, cif_value, cif_loop_value)
         test_type: Test type to match (match, within, etc.) or None
+        results_index: Precomputed _index_expected_results table for test_case
 
     Returns:
         Index of matching result or None if not found
     """
-    expected_results = test_case.get("expected_results", [])
-    for idx, res in enumerate(expected_results):
-        if not isinstance(res, dict):
-            continue
-        if res.get("result_type") != result_type:
-            continue
-        if test_type is not None and res.get("test_type") != test_type:
-            continue
-        return idx
-    return None
+    if results_index is None:
+        results_index = _index_expected_results(test_case)
+    return results_index.get((result_type, test_type))
@@ -1,36 +1,110 @@
-from abc import ABC, abstractmethod
+import os
+from collections.abc import Iterable, Sequence
 from io import StringIO
+from pathlib import Path
+from typing import Any, Protocol
 
+from CifFile import ReadCif
 
-class CIFIOAdapter(ABC):
-    @abstractmethod
-    def __init__(self, cif_text: str):
-        pass
+# gemmi is optional, its C++ parser reads large CIF files much faster than PyCIFRW
+try:
+    from gemmi import cif as gemmi_cif
+except ImportError:  # pragma: no cover - depends on the environment
+    gemmi_cif = None
 
-    @abstractmethod
-    def get_entry_from_cif_block(self, entry_name: str) -> str | int | float | bool:
-        pass
 
-    @abstractmethod
+class CIFIOAdapter(Protocol):
+    """Read access to a parsed CIF block, as used by the test implementations."""
+
+    def get_entry_from_cif_block(self, entry_name: str) -> str | int | float | bool: ...
+
     def get_loop_entry_from_cif_block(
-        self, entry_name: str, row_lookups: list[tuple[str, str]]
-    ) -> str | int | float | bool:
-        pass
+        self, entry_name: str, row_lookups: Sequence[tuple[str, str]]
+    ) -> str | int | float | bool: ...
 
 
 class ValueMissingError(Exception):
     pass
 
 
-class PyCIFRWAdapter(CIFIOAdapter):
-    def __init__(self, cif_text: str):
-        from CifFile import ReadCif
+def _parse_first_block(cif_text: str):
+    """Parse CIF text with PyCIFRW and return its first block."""
+    cf = ReadCif(StringIO(cif_text))
+    return cf.first_block()
+
 
-        string_io = StringIO(cif_text)
+def _build_row_index(columns: Iterable[Sequence[str]]) -> dict[tuple[str, ...], list[int]]:
+    """Map each tuple of values in the given loop columns to the indexes of the rows holding it."""
+    index: dict[tuple[str, ...], list[int]] = {}
+    for idx, values in enumerate(zip(*columns, strict=True)):
+        index.setdefault(values, []).append(idx)
+    return index
+
+
+def _single_row(candidates: list[int], row_lookups: Sequence[tuple[str, str]]) -> int:
+    """
+    Return the only row index in candidates.
+
+    Raises:
+        ValueError: If no row or more than one row matched the lookups
+    """
+    if len(candidates) == 1:
+        return candidates[0]
+
+    # More than one or none found
+    lookup_desc = " AND ".join(f"{name}={val}" for name, val in row_lookups)
+    if len(candidates) > 1:
+        # Only report a sample of the rows, the loop may contain thousands of duplicates
+        rows = " ".join(str(idx) for idx in sorted(candidates)[:20])
+        raise ValueError(
+            f"More than one row ({len(candidates)}) found matching conditions: {lookup_desc}. Indexes in loop {rows}"
+        )
+    raise ValueError(f"No row found matching conditions: {lookup_desc}")
+
+
+class PyCIFRWAdapter:
+    def __init__(self, cif_text: str):
+        self._init_block(_parse_first_block(cif_text))
 
-        cf = ReadCif(string_io)
-        block = cf.first_block()
+    def _init_block(self, block) -> None:
+        """Set up the adapter state for a parsed block, shared by all constructors."""
         self.block = block
+        # Lazily built lookup column names -> {row values: [row indexes]} tables
+        self._row_index: dict[tuple[str, ...], dict[tuple[str, ...], list[int]]] = {}
+        # Entry name -> containing loop, as returned by block.GetLoop
+        self._loop_cache: dict[str, Any] = {}
+
+    @classmethod
+    def from_path(cls, path: str | Path) -> "PyCIFRWAdapter":
+        """
+        Create an adapter by letting PyCIFRW read a CIF file from disk.
+
+        This avoids reading the file into a string first.
+        """
+        adapter = cls.__new__(cls)
+        adapter._init_block(ReadCif(str(path)).first_block())
+        return adapter
+
+    def _rows_matching(self, loop, row_lookups: Sequence[tuple[str, str]]) -> list[int]:
+        """
+        Return the indexes of the loop rows matching all (column_name, value) lookups.
+
+        The rows are hashed once per combination of lookup columns, so later
+        lookups on the same columns are a single dictionary access.
+
+        Raises:
+            KeyError: If a lookup column is not in the given loop
+        """
+        column_names = tuple(name for name, _ in row_lookups)
+        # The index is keyed by column names only, which is unambiguous as long
+        # as every column belongs to this loop. Check that before using the cache.
+        for name in column_names:
+            if name not in loop:
+                raise KeyError(f"{name} not in loop block")
+        index = self._row_index.get(column_names)
+        if index is None:
+            index = self._row_index[column_names] = _build_row_index(loop[name] for name in column_names)
+        return index.get(tuple(value for _, value in row_lookups), [])
 
     def get_entry_from_cif_block(self, entry_name: str) -> str | int | float | bool:
         """
@@ -46,14 +120,14 @@ class PyCIFRWAdapter(CIFIOAdapter):
         return self.block[entry_name]
 
     def get_loop_entry_from_cif_block(
-        self, entry_name: str, row_lookups: list[tuple[str, str]]
+        self, entry_name: str, row_lookups: Sequence[tuple[str, str]]
     ) -> str | int | float | bool:
         """
         Get a value from a CIF block loop using multiple lookup conditions.
 
         Args:
             entry_name: The CIF entry to extract from the matched row
-            row_lookups: List of (column_name, expected_value) tuples for row matching.
+            row_lookups: Sequence of (column_name, expected_value) tuples for row matching.
                         All conditions must match (AND logic).
 
         Returns:
@@ -72,33 +146,107 @@ class PyCIFRWAdapter(CIFIOAdapter):
             if lookup_name not in self.block:
                 raise ValueMissingError(f"CIF entry '{lookup_name}' not found in CIF block.")
 
-        # Get the loop
-        loop = self.block.GetLoop(entry_name)
+        # Get the loop, GetLoop searches the whole block so the result is kept per entry
+        loop = self._loop_cache.get(entry_name)
+        if loop is None:
+            loop = self._loop_cache[entry_name] = self.block.GetLoop(entry_name)
 
-        # Validate entry exists
-        if entry_name not in self.block:
+        row = _single_row(self._rows_matching(loop, row_lookups), row_lookups)
+        return loop[entry_name][row]
+
+
+def _gemmi_value_to_str(raw: str) -> str:
+    """Convert a raw gemmi token to the string PyCIFRW returns for it."""
+    # PyCIFRW keeps the unknown and inapplicable markers, gemmi.cif.as_string turns them into ''
+    if raw in ("?", "."):
+        return raw
+    return gemmi_cif.as_string(raw)
+
+
+class GemmiAdapter:
+    """
+    CIF adapter backed by the optional gemmi package.
+
+    Values are returned in the same form as from PyCIFRWAdapter: strings with
+    quotes and text field delimiters removed, '?' and '.' kept as they are.
+    """
+
+    def __init__(self, cif_text: str):
+        if gemmi_cif is None:
+            raise ImportError("GemmiAdapter requires the optional gemmi package (pip install gemmi)")
+        # Keep the document referenced, its blocks are only valid while it is alive
+        self.document = gemmi_cif.read_string(cif_text)
+        self.block = self.document[0]
+        # Lazily built lookup column names -> {row values: [row indexes]} tables
+        self._row_index: dict[tuple[str, ...], dict[tuple[str, ...], list[int]]] = {}
+        # Loop entry name -> column values converted with _gemmi_value_to_str
+        self._columns: dict[str, list[str]] = {}
+
+    def _column(self, entry_name: str) -> list[str]:
+        column = self._columns.get(entry_name)
+        if column is None:
+            column = self._columns[entry_name] = [_gemmi_value_to_str(raw) for raw in self.block.find_loop(entry_name)]
+        return column
+
+    def get_entry_from_cif_block(self, entry_name: str) -> str | int | float | bool:
+        """
+        Get a value from the CIF block using an entry name.
+
+        Like PyCIFRW, an entry inside a loop returns the list of its values.
+        """
+        raw = self.block.find_value(entry_name)
+        if raw is not None:
+            return _gemmi_value_to_str(raw)
+        if not self.block.find_loop(entry_name):
             raise ValueMissingError(f"CIF entry '{entry_name}' not found in CIF block.")
+        return self._column(entry_name)
 
-        # Validate all lookup columns exist
+    def get_loop_entry_from_cif_block(
+        self, entry_name: str, row_lookups: Sequence[tuple[str, str]]
+    ) -> str | int | float | bool:
+        """
+        Get a value from a CIF block loop using multiple lookup conditions.
+
+        Behaves like PyCIFRWAdapter.get_loop_entry_from_cif_block.
+
+        Raises:
+            ValueMissingError: If entry_name or any lookup column doesn't exist
+            KeyError: If entry_name is not in a loop or a lookup column is in another loop
+            ValueError: If not exactly one row matches all lookup conditions
+        """
+        for name in (entry_name, *(lookup_name for lookup_name, _ in row_lookups)):
+            if not self.block.find_values(name):
+                raise ValueMissingError(f"CIF entry '{name}' not found in CIF block.")
+
+        loop = self.block.find_loop(entry_name).get_loop()
+        if loop is None:
+            raise KeyError(f"{entry_name} is not in a loop structure")
         for lookup_name, _ in row_lookups:
-            if lookup_name not in self.block:
-                raise ValueMissingError(f"CIF entry '{lookup_name}' not found in CIF block.")
+            if lookup_name not in loop.tags:
+                raise KeyError(f"{lookup_name} is not in the same loop as {entry_name}")
+
+        column_names = tuple(name for name, _ in row_lookups)
+        index = self._row_index.get(column_names)
+        if index is None:
+            index = self._row_index[column_names] = _build_row_index(self._column(name) for name in column_names)
+        row = _single_row(index.get(tuple(value for _, value in row_lookups), []), row_lookups)
+        return self._column(entry_name)[row]
+
 
-        # Get the loop
-        loop = self.block.GetLoop(entry_name)
+_ADAPTER_CLASSES = {"pycifrw": PyCIFRWAdapter, "gemmi": GemmiAdapter}
 
-        # Find the indexes matching the lookup conditions
-        indexes = [set(idx for idx, val in enumerate(loop[key]) if val == test_val) for key, test_val in row_lookups]
 
-        # get the overlap between the index sets
-        overlap = indexes[0].intersection(*indexes[1:])
+def make_cif_adapter(cif_text: str) -> CIFIOAdapter:
+    """
+    Create the CIF adapter for the backend named in $QCRBOX_CIF_BACKEND.
 
-        if len(overlap) == 1:
-            return loop[entry_name][next(iter(overlap))]
+    The backend is either 'pycifrw' (the default) or 'gemmi'.
 
-        # More than one or none found
-        lookup_desc = " AND ".join(f"{name}={val}" for name, val in row_lookups)
-        if len(overlap) > 1:
-            rows = " ".join(overlap)
-            raise ValueError(f"More than one row found matching conditions: {lookup_desc}. Indexes in loop {rows}")
-        raise ValueError(f"No row found matching conditions: {lookup_desc}")
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    backend = os.environ.get("QCRBOX_CIF_BACKEND", "pycifrw").lower()
+    adapter_class = _ADAPTER_CLASSES.get(backend)
+    if adapter_class is None:
+        raise ValueError(f"Unknown CIF backend '{backend}', expected one of: {', '.join(_ADAPTER_CLASSES)}")
+    return adapter_class(cif_text)
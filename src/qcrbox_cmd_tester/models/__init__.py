@@ -1,22 +1,58 @@
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Self
 
 import yaml
 from pydantic import BaseModel, Field, TypeAdapter, field_validator, model_validator
 
-from .expected_values import ExpectedResultType
+from .expected_values import ExpectedResultType, InternedStr
+
+# Prefer the libyaml-backed C loader, fall back to the pure Python one
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeLoader as YamlLoader
+
+# orjson is optional (the "orjson" extra), it serializes the dumped suite faster than pydantic's own JSON output
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+# Building a TypeAdapter generates its validation schema, so do it once for all test cases
+_EXPECTED_RESULTS_ADAPTER = TypeAdapter(list[ExpectedResultType])
+
+
+def _find_duplicates(names: Iterable[str]) -> set[str]:
+    """Return the names that occur more than once, in a single pass."""
+    seen = set()
+    duplicates = set()
+    for name in names:
+        (duplicates if name in seen else seen).add(name)
+    return duplicates
+
+
+def _is_non_empty_str(value) -> bool:
+    """Check a raw YAML value the way a str field with min_length=1 would."""
+    return isinstance(value, str) and len(value) > 0
+
+
+# TestCase fields filled from raw YAML strings that must not be empty
+_TEST_CASE_REQUIRED_STRS = ("name", "qcrbox_application_slug", "qcrbox_application_version", "qcrbox_command_name")
+
 
 # ---------------- Input Parameter Models ---------------- #
 
 
 class QCrBoxParameter(BaseModel):
-    model_config = {"str_strip_whitespace": True, "extra": "forbid"}
+    model_config = {"str_strip_whitespace": True, "extra": "forbid", "frozen": True}
 
-    name: str = Field(..., min_length=1)
+    name: InternedStr = Field(..., min_length=1)
     value: str | int | float | bool
 
     @classmethod
-    def from_yaml_dict(cls, data: dict, base_folder: Path) -> Self:
+    def from_yaml_dict(cls, data: dict, base_folder: Path, file_cache: dict[str, str] | None = None) -> Self:
         """Create parameter from YAML dictionary"""
         param_type = data.get("type", "str")
         param_data = {"name": data["name"], "value": data["value"]}
@@ -28,6 +64,7 @@ class QCrBoxParameter(BaseModel):
                 name=data["name"],
                 base_folder=base_folder,
                 upload_filename=upload_filename,
+                file_cache=file_cache,
             )
         elif param_type == "internal_file":
             return QCrBoxFileParameter.from_internal_file(
@@ -38,7 +75,9 @@ class QCrBoxParameter(BaseModel):
 
 
 class QCrBoxFileParameter(BaseModel):
-    name: str = Field(..., min_length=1)
+    model_config = {"frozen": True}
+
+    name: InternedStr = Field(..., min_length=1)
     cif_content: str
     upload_filename: str | None = Field(default=None, description="Filename to use when uploading to QCrBox")
 
@@ -48,15 +87,92 @@ class QCrBoxFileParameter(BaseModel):
 
     @classmethod
     def from_external_file(
-        cls, file_path: str | Path, name: str, base_folder: Path, upload_filename: str | None = None
+        cls,
+        file_path: str | Path,
+        name: str,
+        base_folder: Path,
+        upload_filename: str | None = None,
+        file_cache: dict[str, str] | None = None,
     ) -> Self:
-        file_path = Path(file_path)
-        if not file_path.is_absolute():
-            file_path = base_folder / file_path
-        file_content = file_path.read_text()
+        """
+        Create a file parameter from a file, relative paths are resolved against base_folder.
+
+        file_cache maps absolute paths to file contents. Sharing one dict between
+        the parameters of a suite reads each file only once. Files are assumed not
+        to change while the suite is being loaded.
+        """
+        file_path = _resolve_external_path(file_path, base_folder)
+        if file_cache is None:
+            file_content = _read_text(file_path)
+        else:
+            key = str(file_path.resolve())
+            file_content = file_cache.get(key)
+            if file_content is None:
+                # Read through the unresolved path, so errors show the path as written in the YAML file
+                file_content = file_cache[key] = _read_text(file_path)
         return cls(name=name, cif_content=file_content, upload_filename=upload_filename)
 
 
+def _resolve_external_path(file_path: str | Path, base_folder: Path) -> Path:
+    """Resolve an external_file parameter value relative to the YAML file folder."""
+    file_path = Path(file_path)
+    if not file_path.is_absolute():
+        file_path = base_folder / file_path
+    return file_path
+
+
+def _read_text(file_path: Path) -> str:
+    """
+    Read a UTF-8 text file.
+
+    The content is read as bytes in one go and decoded once. Windows and old
+    Mac line endings are translated to newlines first, as Path.read_text did.
+    """
+    with open(file_path, "rb", buffering=0) as file:
+        content = file.read()
+    if b"\r" in content:
+        content = content.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    return content.decode("utf-8")
+
+
+def _try_read_text(file_path: Path) -> str | None:
+    """Read a file for the file cache, leaving errors to the parameter that uses it."""
+    try:
+        return _read_text(file_path)
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def _prefetch_external_files(data: dict, base_folder: Path) -> dict[str, str]:
+    """
+    Read the files of all external_file parameters in a suite concurrently.
+
+    Returns the file cache used while loading the suite, mapping absolute paths
+    to file contents. Fixtures referenced by several test cases are only read
+    once, and the contents are dropped once the suite is loaded. Files that
+    cannot be read are not cached, so the error is raised as before when the
+    parameter itself is parsed. Malformed entries are skipped here and
+    reported by the regular parsing.
+    """
+    file_cache: dict[str, str] = {}
+    paths = {}
+    for test_data in data.get("test_cases", []):
+        if not isinstance(test_data, dict):
+            continue
+        for param in test_data.get("input_parameters", []):
+            if isinstance(param, dict) and param.get("type") == "external_file" and isinstance(param.get("value"), str):
+                file_path = _resolve_external_path(param["value"], base_folder)
+                paths.setdefault(str(file_path.resolve()), file_path)
+    if len(paths) < 2:
+        return file_cache
+
+    with ThreadPoolExecutor(max_workers=min(32, len(paths))) as pool:
+        for key, content in zip(paths, pool.map(_try_read_text, paths.values()), strict=True):
+            if content is not None:
+                file_cache[key] = content
+    return file_cache
+
+
 # union of all parameter types
 QCrBoxParameterType = QCrBoxParameter | QCrBoxFileParameter
 
@@ -75,26 +191,45 @@ class TestCase(BaseModel):
     expected_results: list[ExpectedResultType] = Field(default_factory=list)
 
     @classmethod
-    def from_yaml_dict(cls, data: dict, application_slug: str, application_version: str, base_folder: Path) -> Self:
+    def from_yaml_dict(
+        cls,
+        data: dict,
+        application_slug: str,
+        application_version: str,
+        base_folder: Path,
+        file_cache: dict[str, str] | None = None,
+    ) -> Self:
         """Create TestCase from YAML dictionary"""
         # Parse parameters
         parameters = [
-            QCrBoxParameter.from_yaml_dict(param, base_folder=base_folder) for param in data.get("input_parameters", [])
+            QCrBoxParameter.from_yaml_dict(param, base_folder=base_folder, file_cache=file_cache)
+            for param in data.get("input_parameters", [])
         ]
 
         # Parse expected results - Pydantic handles discrimination automatically
-        expected_results_adapter = TypeAdapter(list[ExpectedResultType])
-        expected_results = expected_results_adapter.validate_python(data.get("expected_results", []))
-
-        return cls(
-            name=data["name"],
-            description=data.get("description", ""),
-            qcrbox_application_slug=application_slug,
-            qcrbox_application_version=application_version,
-            qcrbox_command_name=data["command_name"],
-            qcrbox_command_parameters=parameters,
-            expected_results=expected_results,
-        )
+        expected_results = _EXPECTED_RESULTS_ADAPTER.validate_python(data.get("expected_results", []))
+
+        fields = {
+            "name": data["name"],
+            "description": data.get("description", ""),
+            "qcrbox_application_slug": application_slug,
+            "qcrbox_application_version": application_version,
+            "qcrbox_command_name": data["command_name"],
+            "qcrbox_command_parameters": parameters,
+            "expected_results": expected_results,
+        }
+
+        # The parameters and expected results are validated models already. If the
+        # remaining checks pass, skip validating everything again, otherwise let
+        # validation raise the usual ValidationError.
+        if (
+            expected_results
+            and isinstance(fields["description"], str)
+            and all(_is_non_empty_str(fields[key]) for key in _TEST_CASE_REQUIRED_STRS)
+            and not _find_duplicates(p.name for p in parameters)
+        ):
+            return cls.model_construct(**fields)
+        return cls(**fields)
 
     @field_validator("expected_results")
     @classmethod
@@ -105,9 +240,8 @@ class TestCase(BaseModel):
 
     @model_validator(mode="after")
     def validate_parameter_names_unique(self):
-        names = [p.name for p in self.qcrbox_command_parameters]
-        if len(names) != len(set(names)):
-            duplicates = {n for n in names if names.count(n) > 1}
+        duplicates = _find_duplicates(p.name for p in self.qcrbox_command_parameters)
+        if duplicates:
             raise ValueError(f"Duplicate parameter names found: {duplicates}")
         return self
 
@@ -126,24 +260,36 @@ class TestSuite(BaseModel):
         application_slug = data["application_slug"]
         application_version = data["application_version"]
 
+        file_cache = _prefetch_external_files(data, base_folder)
         tests = [
-            TestCase.from_yaml_dict(test_data, application_slug, application_version, base_folder)
+            TestCase.from_yaml_dict(test_data, application_slug, application_version, base_folder, file_cache)
             for test_data in data.get("test_cases", [])
         ]
 
-        return cls(
-            application_slug=application_slug,
-            application_version=application_version,
-            description=data.get("description", ""),
-            tests=tests,
-        )
+        fields = {
+            "application_slug": application_slug,
+            "application_version": application_version,
+            "description": data.get("description", ""),
+            "tests": tests,
+        }
+
+        # Same shortcut as in TestCase.from_yaml_dict, the test cases are validated models
+        if (
+            tests
+            and isinstance(fields["description"], str)
+            and _is_non_empty_str(application_slug)
+            and _is_non_empty_str(application_version)
+            and not _find_duplicates(t.name for t in tests)
+        ):
+            return cls.model_construct(**fields)
+        return cls(**fields)
 
     @classmethod
     def from_yaml_file(cls, file_path: str | Path) -> Self:
         """Load TestSuite directly from YAML file"""
         file_path = Path(file_path)
-        with open(file_path) as file:
-            data = yaml.safe_load(file)
+        with open(file_path, "rb") as file:
+            data = yaml.load(file, Loader=YamlLoader)
         return cls.from_yaml_dict(data, base_folder=file_path.parent)
 
     @field_validator("tests")
@@ -155,16 +301,19 @@ class TestSuite(BaseModel):
 
     @model_validator(mode="after")
     def validate_test_names_unique(self):
-        names = [t.name for t in self.tests]
-        if len(names) != len(set(names)):
-            duplicates = {n for n in names if names.count(n) > 1}
+        duplicates = _find_duplicates(t.name for t in self.tests)
+        if duplicates:
             raise ValueError(f"Duplicate test names found: {duplicates}")
         return self
 
     def to_json_file(self, file_path: str):
         """Export test suite to JSON"""
-        with open(file_path, "w") as f:
-            f.write(self.model_dump_json(indent=2))
+        if orjson is not None:
+            with open(file_path, "wb") as f:
+                f.write(orjson.dumps(self.model_dump(mode="json"), option=orjson.OPT_INDENT_2))
+        else:
+            with open(file_path, "w") as f:
+                f.write(self.model_dump_json(indent=2))
 
     def to_dict(self) -> dict:
         """Export to dictionary"""
@@ -1,7 +1,18 @@
+import sys
 from abc import ABC
-from typing import Annotated, Literal
+from functools import cached_property
+from typing import Annotated, Any, Literal
 
-from pydantic import BaseModel, Discriminator, Field, Tag, TypeAdapter
+from pydantic import AfterValidator, BaseModel, Discriminator, Field, Tag, TypeAdapter, model_validator
+
+# Entry and parameter names repeat across many tests, interning them shares one string
+# object per name and lets dict lookups on them succeed on the identity check
+InternedStr = Annotated[str, AfterValidator(sys.intern)]
+
+
+# Key combinations accepted by data_to_minmax
+_DEVIATION_KEYS = frozenset(("expected_value", "allowed_deviation"))
+_MIN_MAX_KEYS = frozenset(("min_value", "max_value"))
 
 
 def data_to_minmax(data: dict) -> tuple[float, float]:
@@ -13,11 +24,8 @@ def data_to_minmax(data: dict) -> tuple[float, float]:
     1. expected_value + allowed_deviation
     2. min_value + max_value
     """
-    combination1 = ("expected_value", "allowed_deviation")
-    combination2 = ("min_value", "max_value")
-
-    has1 = all(key in data for key in combination1)
-    has2 = all(key in data for key in combination2)
+    has1 = _DEVIATION_KEYS <= data.keys()
+    has2 = _MIN_MAX_KEYS <= data.keys()
 
     if not (has1 or has2):
         raise ValueError("Within test requires either (expected_value + allowed_deviation) or (min_value + max_value)")
@@ -36,6 +44,44 @@ def data_to_minmax(data: dict) -> tuple[float, float]:
     return min_val, max_val
 
 
+# Input keys of the two 'within' formats, replaced by the normalized min_value/max_value
+_RANGE_INPUT_KEYS = ("expected_value", "allowed_deviation", "min_value", "max_value")
+
+
+class _WithinRangeMixin:
+    """
+    Shared input normalization for the 'within' tests.
+
+    Accepts either input format handled by data_to_minmax and passes only
+    min_value/max_value on to the model fields.
+    """
+
+    @model_validator(mode="before")
+    @classmethod
+    def normalize_range(cls, data: Any) -> Any:
+        if not isinstance(data, dict):
+            return data
+        normalized = {key: val for key, val in data.items() if key not in _RANGE_INPUT_KEYS}
+        normalized["min_value"], normalized["max_value"] = data_to_minmax(data)
+        return normalized
+
+
+class _ExpectedStrMixin:
+    """expected_value as the stripped string used by the string comparison of 'match' tests."""
+
+    @cached_property
+    def expected_str(self) -> str:
+        return str(self.expected_value).strip()
+
+
+class _ForbiddenStrMixin:
+    """forbidden_value as the stripped string used by the string comparison of 'non-match' tests."""
+
+    @cached_property
+    def forbidden_str(self) -> str:
+        return str(self.forbidden_value).strip()
+
+
 # ============================================================================
 # Base Classes
 # ============================================================================
@@ -49,9 +95,13 @@ class BaseExpectedResult(BaseModel, ABC):
     - Common structure for result_type discrimination
     - Factory method interface for YAML parsing
     - Type safety via Pydantic models
+
+    Values derived from the fields, such as expected_str, are cached_property
+    attributes computed on first use. model_copy(update=...) skips validation
+    and copies them unchanged, so create modified results with model_validate.
     """
 
-    pass
+    model_config = {"frozen": True, "extra": "forbid"}
 
 
 # ============================================================================
@@ -90,10 +140,10 @@ class BaseCifEntryExpectedResult(BaseExpectedResult, ABC):
     """
 
     result_type: Literal["cif_value"] = "cif_value"
-    cif_entry_name: str = Field(..., min_length=1)
+    cif_entry_name: InternedStr = Field(..., min_length=1)
 
 
-class CifEntryMatchExpectedResult(BaseCifEntryExpectedResult):
+class CifEntryMatchExpectedResult(_ExpectedStrMixin, BaseCifEntryExpectedResult):
     """
     Tests that a CIF entry exactly matches an expected value.
 
@@ -110,7 +160,7 @@ class CifEntryMatchExpectedResult(BaseCifEntryExpectedResult):
     expected_value: str | int | float | bool
 
 
-class CifEntryNonMatchExpectedResult(BaseCifEntryExpectedResult):
+class CifEntryNonMatchExpectedResult(_ForbiddenStrMixin, BaseCifEntryExpectedResult):
     """
     Tests that a CIF entry does NOT match a forbidden value.
 
@@ -128,7 +178,7 @@ class CifEntryNonMatchExpectedResult(BaseCifEntryExpectedResult):
     forbidden_value: str | int | float | bool
 
 
-class CifEntryWithinExpectedResult(BaseCifEntryExpectedResult):
+class CifEntryWithinExpectedResult(_WithinRangeMixin, BaseCifEntryExpectedResult):
     """
     Tests that a numerical CIF entry falls within an acceptable range.
 
@@ -159,13 +209,6 @@ class CifEntryWithinExpectedResult(BaseCifEntryExpectedResult):
     min_value: float
     max_value: float
 
-    def __init__(self, **data):
-        deterministic_entries = ("expected_value", "allowed_deviation", "min_value", "max_value")
-        cls_data = {key: val for key, val in data.items() if key not in deterministic_entries}
-
-        cls_data["min_value"], cls_data["max_value"] = data_to_minmax(data)
-        super().__init__(**cls_data)
-
 
 class CifEntryContainExpectedResult(BaseCifEntryExpectedResult):
     """
@@ -242,7 +285,9 @@ class RowLookup(BaseModel):
         matches rows where _loop_entry.index == 2
     """
 
-    row_entry_name: str = Field(..., min_length=1)
+    model_config = {"frozen": True, "extra": "forbid"}
+
+    row_entry_name: InternedStr = Field(..., min_length=1)
     row_entry_value: str | int | float | bool
 
 
@@ -276,10 +321,20 @@ class BaseCifLoopEntryExpectedResult(BaseExpectedResult, ABC):
 
     result_type: Literal["cif_loop_value"] = "cif_loop_value"
     row_lookup: list[RowLookup] = Field(..., min_length=1)
-    cif_entry_name: str = Field(..., min_length=1)
+    cif_entry_name: InternedStr = Field(..., min_length=1)
+
+    @cached_property
+    def row_lookup_key(self) -> tuple[tuple[str, str], ...]:
+        """The row_lookup conditions as (column name, value as str) pairs."""
+        return tuple((lookup.row_entry_name, str(lookup.row_entry_value)) for lookup in self.row_lookup)
 
+    @cached_property
+    def lookup_desc(self) -> str:
+        """The row_lookup conditions as 'name=value' terms joined by AND, for log messages."""
+        return " AND ".join(f"{lookup.row_entry_name}={lookup.row_entry_value}" for lookup in self.row_lookup)
 
-class CifLoopEntryMatchExpectedResult(BaseCifLoopEntryExpectedResult):
+
+class CifLoopEntryMatchExpectedResult(_ExpectedStrMixin, BaseCifLoopEntryExpectedResult):
     """
     Tests that a specific loop entry exactly matches an expected value.
 
@@ -311,7 +366,7 @@ class CifLoopEntryMatchExpectedResult(BaseCifLoopEntryExpectedResult):
     expected_value: str | int | float | bool
 
 
-class CifLoopEntryNonMatchExpectedResult(BaseCifLoopEntryExpectedResult):
+class CifLoopEntryNonMatchExpectedResult(_ForbiddenStrMixin, BaseCifLoopEntryExpectedResult):
     """
     Tests that a specific loop entry does NOT match a forbidden value.
 
@@ -332,7 +387,7 @@ class CifLoopEntryNonMatchExpectedResult(BaseCifLoopEntryExpectedResult):
     forbidden_value: str | int | float | bool
 
 
-class CifLoopEntryWithinExpectedResult(BaseCifLoopEntryExpectedResult):
+class CifLoopEntryWithinExpectedResult(_WithinRangeMixin, BaseCifLoopEntryExpectedResult):
     """
     Tests that a numerical loop entry falls within an acceptable range.
 
@@ -367,13 +422,6 @@ class CifLoopEntryWithinExpectedResult(BaseCifLoopEntryExpectedResult):
     min_value: float
     max_value: float
 
-    def __init__(self, **data):
-        deterministic_entries = ("expected_value", "allowed_deviation", "min_value", "max_value")
-        cls_data = {key: val for key, val in data.items() if key not in deterministic_entries}
-
-        cls_data["min_value"], cls_data["max_value"] = data_to_minmax(data)
-        super().__init__(**cls_data)
-
 
 class CifLoopEntryContainExpectedResult(BaseCifLoopEntryExpectedResult):
     """
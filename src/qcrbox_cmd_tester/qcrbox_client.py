@@ -6,7 +6,9 @@ running commands, and retrieving results.
 """
 
 import io
-import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
 from qcrboxapiclient.api.calculations import get_calculation_by_id
@@ -25,6 +27,44 @@ from qcrboxapiclient.models import (
 )
 from qcrboxapiclient.types import File
 
+from .models import QCrBoxFileParameter
+
+logger = logging.getLogger(__name__)
+
+# Calculation status polling delays in seconds
+_POLL_INITIAL_DELAY = 0.1
+_POLL_BACKOFF_FACTOR = 1.7
+_POLL_MAX_DELAY = 5.0
+
+# Maximum number of concurrent dataset uploads/deletions per command
+_MAX_TRANSFER_WORKERS = 8
+
+# Responses of the generated API client that mean a request did not succeed
+_ERROR_RESPONSE_TYPES = (QCrBoxErrorResponse, type(None))
+
+# Set on interrupt, wakes every command that is waiting for its calculation to finish
+_cancel_event = threading.Event()
+
+
+class CommandCancelledError(Exception):
+    """Raised by run_qcrbox_command once cancel_running_commands has been called."""
+
+
+def cancel_running_commands() -> None:
+    """
+    Stop all commands that are still waiting on QCrBox.
+
+    Their run_qcrbox_command calls raise CommandCancelledError at the next
+    status poll, after deleting their datasets. Commands started afterwards
+    are cancelled right away until reset_cancellation is called.
+    """
+    _cancel_event.set()
+
+
+def reset_cancellation() -> None:
+    """Allow commands to run again after cancel_running_commands."""
+    _cancel_event.clear()
+
 
 @dataclass
 class CommandRunResult:
@@ -35,13 +75,26 @@ class CommandRunResult:
     status_events: list  # List of CalculationStatusDetails
 
 
-def upload_cif_as_dataset(client: Client, cif_text: str, file_name: str) -> tuple[str, str]:
+def _unwrap(response, context: str):
+    """
+    Return a successful API response, raising for error responses.
+
+    Raises:
+        TypeError: If the response is an error response or missing
+    """
+    if isinstance(response, _ERROR_RESPONSE_TYPES):
+        raise TypeError(context, response)
+    return response
+
+
+def upload_cif_as_dataset(client: Client, cif_text: str | bytes, file_name: str) -> tuple[str, str]:
     """
     Upload a CIF file to QCrBox and create a dataset.
 
     Args:
         client: The QCrBox API client
-        cif_text: The CIF file content as a string
+        cif_text: The CIF file content, as a string or as UTF-8 encoded bytes
+            which are uploaded without re-encoding
         file_name: The name for the uploaded file
 
     Returns:
@@ -50,13 +103,12 @@ def upload_cif_as_dataset(client: Client, cif_text: str, file_name: str) -> tupl
     Raises:
         TypeError: If the upload fails
     """
-    cifb = cif_text.encode("utf-8")
+    cifb = cif_text if isinstance(cif_text, (bytes, bytearray)) else cif_text.encode("utf-8")
+    # BytesIO shares the buffer of an immutable bytes object instead of copying it
     file = File(io.BytesIO(cifb), file_name)
     upload_payload = CreateDatasetBody(file)
 
-    response = create_dataset.sync(client=client, body=upload_payload)
-    if isinstance(response, QCrBoxErrorResponse) or response is None:
-        raise TypeError("Failed to upload file", response)
+    response = _unwrap(create_dataset.sync(client=client, body=upload_payload), "Failed to upload file")
 
     dataset_id = response.payload.datasets[0].qcrbox_dataset_id
     data_file_id = response.payload.datasets[0].data_files[file_name].qcrbox_file_id
@@ -64,6 +116,23 @@ def upload_cif_as_dataset(client: Client, cif_text: str, file_name: str) -> tupl
     return dataset_id, data_file_id
 
 
+def delete_datasets(client: Client, dataset_ids: list[str]) -> None:
+    """
+    Delete QCrBox datasets, concurrently if there is more than one.
+
+    Args:
+        client: The QCrBox API client
+        dataset_ids: IDs of the datasets to delete
+    """
+    if len(dataset_ids) > 1:
+        with ThreadPoolExecutor(max_workers=min(len(dataset_ids), _MAX_TRANSFER_WORKERS)) as executor:
+            # Consume the results so that errors from any deletion are raised here
+            list(executor.map(lambda dataset_id: delete_dataset_by_id.sync(id=dataset_id, client=client), dataset_ids))
+    else:
+        for dataset_id in dataset_ids:
+            delete_dataset_by_id.sync(id=dataset_id, client=client)
+
+
 def run_qcrbox_command(
     client: Client,
     command_name: str,
@@ -83,52 +152,74 @@ def run_qcrbox_command(
 
     Returns:
         CommandRunResult with status and output
+
+    Raises:
+        CommandCancelledError: If cancel_running_commands was called before the command finished
     """
+    if _cancel_event.is_set():
+        raise CommandCancelledError(f"Command '{command_name}' was cancelled")
+
     parameter_dict, input_file_dataset_ids = prepare_qcrbox_parameters(client, command_parameters)
 
     parameters = InvokeCommandParametersCommandArguments.from_dict(parameter_dict)
-    response = invoke_command.sync(
-        client=client,
-        body=InvokeCommandParameters(
-            application_slug=application_slug,
-            application_version=application_version,
-            command_name=command_name,
-            command_arguments=parameters,
-        ),
-    )
-
-    if isinstance(response, QCrBoxErrorResponse) or response is None:
-        raise TypeError("Failed to invoke command", response)
-
-    calculation_id = response.payload.calculation_id
-
-    # Poll until completion
-    final_response = None
-    while final_response is None:
-        calc_response = get_calculation_by_id.sync(id=calculation_id, client=client)
-        if isinstance(calc_response, QCrBoxErrorResponse) or calc_response is None:
-            raise TypeError("Failed to get calculation status", calc_response)
+    try:
+        response = _unwrap(
+            invoke_command.sync(
+                client=client,
+                body=InvokeCommandParameters(
+                    application_slug=application_slug,
+                    application_version=application_version,
+                    command_name=command_name,
+                    command_arguments=parameters,
+                ),
+            ),
+            "Failed to invoke command",
+        )
 
-        try:
-            final_response = next(
-                resp for resp in calc_response.payload.calculations if resp.status in ("successful", "failed")
+        calculation_id = response.payload.calculation_id
+
+        # Poll until completion, backing off so short calculations return quickly
+        # while long ones do not flood the server with status requests
+        final_response = None
+        delay = _POLL_INITIAL_DELAY
+        while final_response is None:
+            calc_response = _unwrap(
+                get_calculation_by_id.sync(id=calculation_id, client=client), "Failed to get calculation status"
             )
-        except StopIteration:
-            final_response = None
-        time.sleep(1)
 
-    for dataset_id in input_file_dataset_ids:
-        delete_dataset_by_id.sync(id=dataset_id, client=client)
+            final_response = next(
+                (resp for resp in calc_response.payload.calculations if resp.status in ("successful", "failed")), None
+            )
+            # Waiting on the event instead of sleeping lets an interrupt stop the poll right away
+            if final_response is None and _cancel_event.wait(delay):
+                raise CommandCancelledError(f"Command '{command_name}' was cancelled")
+            delay = min(delay * _POLL_BACKOFF_FACTOR, _POLL_MAX_DELAY)
+    except CommandCancelledError:
+        delete_datasets(client, input_file_dataset_ids)
+        raise
+
+    output_dataset_id = final_response.output_dataset_id if final_response.status == "successful" else None
+
+    # Download the output before cleaning up, then delete the input and output datasets together
+    cleanup_dataset_ids = [*input_file_dataset_ids, *([output_dataset_id] if output_dataset_id else [])]
+    dataset_bytes = None
+    try:
+        if output_dataset_id:
+            dataset_bytes = download_dataset_by_id.sync(id=output_dataset_id, client=client)
+    except BaseException:
+        # Keep the download error, a failing cleanup must not replace it
+        try:
+            delete_datasets(client, cleanup_dataset_ids)
+        except Exception:
+            logger.exception("Failed to delete datasets %s after the download failed", cleanup_dataset_ids)
+        raise
+    delete_datasets(client, cleanup_dataset_ids)
 
     if final_response.status == "successful":
-        output_dataset_id = final_response.output_dataset_id
         if not output_dataset_id:
             return CommandRunResult(status="failed", result_cif=None, status_events=final_response.status_events)
 
-        dataset_bytes = download_dataset_by_id.sync(id=output_dataset_id, client=client)
-        delete_dataset_by_id.sync(id=output_dataset_id, client=client)
-
-        if isinstance(dataset_bytes, (QCrBoxErrorResponse, type(None), str)):
+        if isinstance(dataset_bytes, (*_ERROR_RESPONSE_TYPES, str)):
             raise TypeError("Unexpected dataset bytes type", type(dataset_bytes))
 
         return CommandRunResult(
@@ -152,19 +243,24 @@ def prepare_qcrbox_parameters(client: Client, parameters: list) -> dict[str, obj
         Dictionary of parameter names to values (with file parameters
         converted to {'data_file_id': file_id})
     """
-    from .models import QCrBoxFileParameter
-
     # Separate file and non-file parameters
     dataset_params = [param for param in parameters if isinstance(param, QCrBoxFileParameter)]
 
-    # Upload files and get their IDs
-    data_file_ids = {}
-    dataset_ids = []
-    for param in dataset_params:
-        cif_text = param.cif_content
+    def upload(param) -> tuple[str, str]:
         # Use upload_filename if provided, otherwise default to "{param.name}.cif"
         filename = param.upload_filename if param.upload_filename else f"{param.name}.cif"
-        dataset_id, data_file_id = upload_cif_as_dataset(client, cif_text, filename)
+        return upload_cif_as_dataset(client, param.cif_content, filename)
+
+    # Upload files and get their IDs, the uploads are independent so they run concurrently
+    if len(dataset_params) > 1:
+        with ThreadPoolExecutor(max_workers=min(len(dataset_params), _MAX_TRANSFER_WORKERS)) as executor:
+            uploads = list(executor.map(upload, dataset_params))
+    else:
+        uploads = [upload(param) for param in dataset_params]
+
+    data_file_ids = {}
+    dataset_ids = []
+    for param, (dataset_id, data_file_id) in zip(dataset_params, uploads, strict=True):
         data_file_ids[param.name] = data_file_id
         dataset_ids.append(dataset_id)
 
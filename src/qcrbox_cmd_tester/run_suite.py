@@ -5,15 +5,18 @@ This module orchestrates the execution of test suites and test cases,
 delegating QCrBox-specific operations to qcrbox_client.py.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 
 from qcrboxapiclient.client import Client
 
 from qcrbox_cmd_tester.models.expected_values import StatusExpectedResult
 
+from .io_adapters import make_cif_adapter
 from .models import TestCase, TestSuite
-from .qcrbox_client import run_qcrbox_command
-from .test_implementations import IndividualTestResult, check_result
+from .qcrbox_client import cancel_running_commands, reset_cancellation, run_qcrbox_command
+from .test_implementations import IndividualTestResult, check_result_on_adapter
 
 
 @dataclass
@@ -36,13 +39,14 @@ class TestSuiteResult:
     test_results: list[TestCaseResult]
 
 
-def run_test_case(client: Client, test_case: TestCase) -> TestCaseResult:
+def run_test_case(client: Client, test_case: TestCase, fail_fast: bool = False) -> TestCaseResult:
     """
     Execute a single test case against QCrBox.
 
     Args:
         client: QCrBox API client
         test_case: The test case to execute
+        fail_fast: If True, stop checking expected results after the first failure
 
     Returns:
         TestCaseResult with test outcomes
@@ -58,6 +62,7 @@ def run_test_case(client: Client, test_case: TestCase) -> TestCaseResult:
     # Check expected results against command output
     individual_results = []
     all_passed = True
+    adapter = None
     for expected_result in test_case.expected_results:
         if isinstance(expected_result, StatusExpectedResult):
             result = IndividualTestResult(
@@ -70,6 +75,8 @@ def run_test_case(client: Client, test_case: TestCase) -> TestCaseResult:
             individual_results.append(result)
             if not result.passed:
                 all_passed = False
+                if fail_fast:
+                    break
             continue
 
         if command_result.status != "successful":
@@ -81,15 +88,19 @@ def run_test_case(client: Client, test_case: TestCase) -> TestCaseResult:
                 )
             )
             all_passed = False
+            if fail_fast:
+                break
             continue
 
-        result = check_result(
-            cif_text=command_result.result_cif if command_result.result_cif is not None else "",
-            expected_result=expected_result,
-        )
+        # Parse the CIF output once, on the first expected result that needs it
+        if adapter is None:
+            adapter = make_cif_adapter(command_result.result_cif if command_result.result_cif is not None else "")
+        result = check_result_on_adapter(adapter, expected_result)
         individual_results.append(result)
         if not result.passed:
             all_passed = False
+            if fail_fast:
+                break
 
     return TestCaseResult(
         test_case_name=test_case.name,
@@ -100,18 +111,74 @@ def run_test_case(client: Client, test_case: TestCase) -> TestCaseResult:
     )
 
 
-def run_test_suite(client: Client, test_suite: TestSuite) -> TestSuiteResult:
+def _skipped_test_case_result(test_case: TestCase) -> TestCaseResult:
+    """Result for a test case that was not run because an earlier one failed."""
+    return TestCaseResult(
+        test_case_name=test_case.name,
+        all_passed=False,
+        individual_results=[],
+        command_status="skipped",
+    )
+
+
+def run_test_suite(
+    client: Client, test_suite: TestSuite, max_workers: int = 4, fail_fast: bool = False
+) -> TestSuiteResult:
     """
     Execute all test cases in a test suite.
 
+    Test cases are independent and spend most of their time waiting on
+    QCrBox, so they run concurrently on a thread pool sharing the client.
+
     Args:
         client: QCrBox API client
         test_suite: The test suite to execute
+        max_workers: Maximum number of test cases to run at the same time
+        fail_fast: If True, stop at the first failing test case and mark the
+            test cases that have not started yet as skipped
+
+    If a test case raises, the queued test cases are dropped and the running
+    ones are waited for before the error is re-raised. On KeyboardInterrupt
+    the running ones are also cancelled at their next status poll, deleting
+    their datasets.
 
     Returns:
-        TestSuiteResult with all test case results
+        TestSuiteResult with all test case results, in test suite order
     """
-    case_results = [run_test_case(client, test_case) for test_case in test_suite.tests]
+    run_case = partial(run_test_case, client, fail_fast=fail_fast)
+    tests = test_suite.tests
+    workers = min(max_workers, len(tests))
+    case_results = []
+    failed = False
+    if workers <= 1:
+        for test_case in tests:
+            if failed:
+                case_results.append(_skipped_test_case_result(test_case))
+                continue
+            result = run_case(test_case)
+            case_results.append(result)
+            failed = fail_fast and not result.all_passed
+    else:
+        executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            futures = [executor.submit(run_case, test_case) for test_case in tests]
+            for test_case, future in zip(tests, futures, strict=True):
+                # Test cases that are already running cannot be cancelled, keep their results
+                if failed and future.cancel():
+                    case_results.append(_skipped_test_case_result(test_case))
+                    continue
+                result = future.result()
+                case_results.append(result)
+                failed = failed or (fail_fast and not result.all_passed)
+        except KeyboardInterrupt:
+            # Cancelled commands return at their next poll, so this only waits for their cleanup
+            cancel_running_commands()
+            executor.shutdown(wait=True, cancel_futures=True)
+            reset_cancellation()
+            raise
+        finally:
+            # When a test case raises, the queued ones must not keep running QCrBox commands
+            executor.shutdown(wait=True, cancel_futures=True)
     return TestSuiteResult(
         application_slug=test_suite.application_slug,
         all_passed=all(case.all_passed for case in case_results),
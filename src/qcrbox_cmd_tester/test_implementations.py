@@ -2,7 +2,7 @@ from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
-from .io_adapters import CIFIOAdapter, PyCIFRWAdapter, ValueMissingError
+from .io_adapters import CIFIOAdapter, ValueMissingError, make_cif_adapter
 from .models.expected_values import (
     CifEntryContainExpectedResult,
     CifEntryMatchExpectedResult,
@@ -19,8 +19,11 @@ from .models.expected_values import (
     ExpectedResultType,
 )
 
+# CIF markers for unknown (?) and inapplicable (.) values
+_UNDEFINED_VALUES = frozenset(("?", "."))
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class IndividualTestResult:
     test_case_name: str
     passed: bool
@@ -67,6 +70,7 @@ def generate_test_case_name(test_type: str, entry_name: str | None = None) -> st
 
 def test_cif_entry_match(adapter: CIFIOAdapter, expected: CifEntryMatchExpectedResult) -> IndividualTestResult:
     """Test that a CIF entry exactly matches an expected value."""
+    test_case_name = generate_test_case_name("match", expected.cif_entry_name)
     try:
         actual_value = adapter.get_entry_from_cif_block(expected.cif_entry_name)
 
@@ -78,7 +82,7 @@ def test_cif_entry_match(adapter: CIFIOAdapter, expected: CifEntryMatchExpectedR
         except (ValueError, TypeError):
             # Fall back to string comparison
             actual_str = str(actual_value).strip()
-            expected_str = str(expected.expected_value).strip()
+            expected_str = expected.expected_str
             passed = actual_str == expected_str
 
         if passed:
@@ -87,13 +91,13 @@ def test_cif_entry_match(adapter: CIFIOAdapter, expected: CifEntryMatchExpectedR
             log = f"✗ Entry '{expected.cif_entry_name}': expected '{expected.expected_value}', got '{actual_value}'"
 
         return IndividualTestResult(
-            test_case_name=generate_test_case_name("match", expected.cif_entry_name),
+            test_case_name=test_case_name,
             passed=passed,
             log=log,
         )
     except ValueMissingError as e:
         return IndividualTestResult(
-            test_case_name=generate_test_case_name("match", expected.cif_entry_name),
+            test_case_name=test_case_name,
             passed=False,
             log=f"✗ {str(e)}",
         )
@@ -101,6 +105,7 @@ def test_cif_entry_match(adapter: CIFIOAdapter, expected: CifEntryMatchExpectedR
 
 def test_cif_entry_non_match(adapter: CIFIOAdapter, expected: CifEntryNonMatchExpectedResult) -> IndividualTestResult:
     """Test that a CIF entry does NOT match a forbidden value."""
+    test_case_name = generate_test_case_name("non_match", expected.cif_entry_name)
     try:
         actual_value = adapter.get_entry_from_cif_block(expected.cif_entry_name)
 
@@ -112,7 +117,7 @@ def test_cif_entry_non_match(adapter: CIFIOAdapter, expected: CifEntryNonMatchEx
         except (ValueError, TypeError):
             # Fall back to string comparison
             actual_str = str(actual_value).strip()
-            forbidden_str = str(expected.forbidden_value).strip()
+            forbidden_str = expected.forbidden_str
             passed = actual_str != forbidden_str
 
         if passed:
@@ -121,13 +126,13 @@ def test_cif_entry_non_match(adapter: CIFIOAdapter, expected: CifEntryNonMatchEx
             log = f"✗ Entry '{expected.cif_entry_name}' has forbidden value '{expected.forbidden_value}'"
 
         return IndividualTestResult(
-            test_case_name=generate_test_case_name("non_match", expected.cif_entry_name),
+            test_case_name=test_case_name,
             passed=passed,
             log=log,
         )
     except ValueMissingError as e:
         return IndividualTestResult(
-            test_case_name=generate_test_case_name("non_match", expected.cif_entry_name),
+            test_case_name=test_case_name,
             passed=False,
             log=f"✗ {str(e)}",
         )
@@ -135,6 +140,7 @@ def test_cif_entry_non_match(adapter: CIFIOAdapter, expected: CifEntryNonMatchEx
 
 def test_cif_entry_within(adapter: CIFIOAdapter, expected: CifEntryWithinExpectedResult) -> IndividualTestResult:
     """Test that a numerical CIF entry falls within an acceptable range."""
+    test_case_name = generate_test_case_name("within", expected.cif_entry_name)
     try:
         actual_value = adapter.get_entry_from_cif_block(expected.cif_entry_name)
 
@@ -143,7 +149,7 @@ def test_cif_entry_within(adapter: CIFIOAdapter, expected: CifEntryWithinExpecte
             actual_float = float(actual_value)
         except (ValueError, TypeError):
             return IndividualTestResult(
-                test_case_name=generate_test_case_name("within", expected.cif_entry_name),
+                test_case_name=test_case_name,
                 passed=False,
                 log=f"✗ Entry '{expected.cif_entry_name}' value '{actual_value}' is not a valid number",
             )
@@ -156,13 +162,13 @@ def test_cif_entry_within(adapter: CIFIOAdapter, expected: CifEntryWithinExpecte
             log = f"✗ Entry '{expected.cif_entry_name}' value {actual_float} is outside [{expected.min_value}, {expected.max_value}]"
 
         return IndividualTestResult(
-            test_case_name=generate_test_case_name("within", expected.cif_entry_name),
+            test_case_name=test_case_name,
             passed=passed,
             log=log,
         )
     except ValueMissingError as e:
         return IndividualTestResult(
-            test_case_name=generate_test_case_name("within", expected.cif_entry_name),
+            test_case_name=test_case_name,
             passed=False,
             log=f"✗ {str(e)}",
         )
@@ -170,6 +176,7 @@ def test_cif_entry_within(adapter: CIFIOAdapter, expected: CifEntryWithinExpecte
 
 def test_cif_entry_contain(adapter: CIFIOAdapter, expected: CifEntryContainExpectedResult) -> IndividualTestResult:
     """Test that a CIF entry (string) contains a specific substring."""
+    test_case_name = generate_test_case_name("contain", expected.cif_entry_name)
     try:
         actual_value = adapter.get_entry_from_cif_block(expected.cif_entry_name)
         actual_str = str(actual_value)
@@ -182,13 +189,13 @@ def test_cif_entry_contain(adapter: CIFIOAdapter, expected: CifEntryContainExpec
             log = f"✗ Entry '{expected.cif_entry_name}' does not contain '{expected.expected_value}' (actual: '{actual_str}')"
 
         return IndividualTestResult(
-            test_case_name=generate_test_case_name("contain", expected.cif_entry_name),
+            test_case_name=test_case_name,
             passed=passed,
             log=log,
         )
     except ValueMissingError as e:
         return IndividualTestResult(
-            test_case_name=generate_test_case_name("contain", expected.cif_entry_name),
+            test_case_name=test_case_name,
             passed=False,
             log=f"✗ {str(e)}",
         )
@@ -196,18 +203,19 @@ def test_cif_entry_contain(adapter: CIFIOAdapter, expected: CifEntryContainExpec
 
 def test_cif_entry_missing(adapter: CIFIOAdapter, expected: CifEntryMissingExpectedResult) -> IndividualTestResult:
     """Test that a CIF entry does NOT exist in the output."""
+    test_case_name = generate_test_case_name("missing", expected.cif_entry_name)
     try:
         actual_value = adapter.get_entry_from_cif_block(expected.cif_entry_name)
         # If we get here, the entry exists, which means the test failed
         return IndividualTestResult(
-            test_case_name=generate_test_case_name("missing", expected.cif_entry_name),
+            test_case_name=test_case_name,
             passed=False,
             log=f"✗ Entry '{expected.cif_entry_name}' should be missing but was found with value '{actual_value}'",
         )
     except ValueMissingError:
         # Entry is missing, which is what we expect
         return IndividualTestResult(
-            test_case_name=generate_test_case_name("missing", expected.cif_entry_name),
+            test_case_name=test_case_name,
             passed=True,
             log=f"✓ Entry '{expected.cif_entry_name}' is missing as expected",
         )
@@ -215,28 +223,29 @@ def test_cif_entry_missing(adapter: CIFIOAdapter, expected: CifEntryMissingExpec
 
 def test_cif_entry_present(adapter: CIFIOAdapter, expected: CifEntryPresentExpectedResult) -> IndividualTestResult:
     """Test that a CIF entry exists in the output."""
+    test_case_name = generate_test_case_name("present", expected.cif_entry_name)
     try:
         actual_value = adapter.get_entry_from_cif_block(expected.cif_entry_name)
         actual_str = str(actual_value).strip()
 
         # Check if value is undefined (? or .)
-        is_undefined = actual_str in ("?", ".")
+        is_undefined = actual_str in _UNDEFINED_VALUES
 
         if is_undefined and not expected.allow_unknown:
             return IndividualTestResult(
-                test_case_name=generate_test_case_name("present", expected.cif_entry_name),
+                test_case_name=test_case_name,
                 passed=False,
                 log=f"✗ Entry '{expected.cif_entry_name}' is present but has undefined value '{actual_str}' (allow_unknown=False)",
             )
 
         return IndividualTestResult(
-            test_case_name=generate_test_case_name("present", expected.cif_entry_name),
+            test_case_name=test_case_name,
             passed=True,
             log=f"✓ Entry '{expected.cif_entry_name}' is present with value '{actual_value}'",
         )
     except ValueMissingError as e:
         return IndividualTestResult(
-            test_case_name=generate_test_case_name("present", expected.cif_entry_name),
+            test_case_name=test_case_name,
             passed=False,
             log=f"✗ {str(e)}",
         )
@@ -244,11 +253,9 @@ def test_cif_entry_present(adapter: CIFIOAdapter, expected: CifEntryPresentExpec
 
 def test_cif_loop_entry_match(adapter: CIFIOAdapter, expected: CifLoopEntryMatchExpectedResult) -> IndividualTestResult:
     """Test that a specific loop entry exactly matches an expected value."""
+    test_case_name = generate_test_case_name("loop_match", expected.cif_entry_name)
     try:
-        # Convert RowLookup models to tuple list
-        row_lookups = [(lookup.row_entry_name, str(lookup.row_entry_value)) for lookup in expected.row_lookup]
-
-        actual_value = adapter.get_loop_entry_from_cif_block(expected.cif_entry_name, row_lookups)
+        actual_value = adapter.get_loop_entry_from_cif_block(expected.cif_entry_name, expected.row_lookup_key)
 
         # Try numerical comparison first
         try:
@@ -258,13 +265,11 @@ def test_cif_loop_entry_match(adapter: CIFIOAdapter, expected: CifLoopEntryMatch
         except (ValueError, TypeError):
             # Fall back to string comparison
             actual_str = str(actual_value).strip()
-            expected_str = str(expected.expected_value).strip()
+            expected_str = expected.expected_str
             passed = actual_str == expected_str
 
-        # Build lookup description for log messages
-        lookup_desc = " AND ".join(
-            f"{lookup.row_entry_name}={lookup.row_entry_value}" for lookup in expected.row_lookup
-        )
+        # Lookup description for log messages, built once per expected result
+        lookup_desc = expected.lookup_desc
 
         if passed:
             log = f"✓ Loop entry '{expected.cif_entry_name}' (where {lookup_desc}) matches expected value '{expected.expected_value}'"
@@ -272,13 +277,13 @@ def test_cif_loop_entry_match(adapter: CIFIOAdapter, expected: CifLoopEntryMatch
             log = f"✗ Loop entry '{expected.cif_entry_name}' (where {lookup_desc}): expected '{expected.expected_value}', got '{actual_value}'"
 
         return IndividualTestResult(
-            test_case_name=generate_test_case_name("loop_match", expected.cif_entry_name),
+            test_case_name=test_case_name,
             passed=passed,
             log=log,
         )
     except (ValueMissingError, ValueError, IndexError) as e:
         return IndividualTestResult(
-            test_case_name=generate_test_case_name("loop_match", expected.cif_entry_name),
+            test_case_name=test_case_name,
             passed=False,
             log=f"✗ {str(e)}",
         )
@@ -288,11 +293,9 @@ def test_cif_loop_entry_non_match(
     adapter: CIFIOAdapter, expected: CifLoopEntryNonMatchExpectedResult
 ) -> IndividualTestResult:
     """Test that a specific loop entry does NOT match a forbidden value."""
+    test_case_name = generate_test_case_name("loop_non_match", expected.cif_entry_name)
     try:
-        # Convert RowLookup models to tuple list
-        row_lookups = [(lookup.row_entry_name, str(lookup.row_entry_value)) for lookup in expected.row_lookup]
-
-        actual_value = adapter.get_loop_entry_from_cif_block(expected.cif_entry_name, row_lookups)
+        actual_value = adapter.get_loop_entry_from_cif_block(expected.cif_entry_name, expected.row_lookup_key)
 
         # Try numerical comparison first
         try:
@@ -302,13 +305,11 @@ def test_cif_loop_entry_non_match(
         except (ValueError, TypeError):
             # Fall back to string comparison
             actual_str = str(actual_value).strip()
-            forbidden_str = str(expected.forbidden_value).strip()
+            forbidden_str = expected.forbidden_str
             passed = actual_str != forbidden_str
 
-        # Build lookup description for log messages
-        lookup_desc = " AND ".join(
-            f"{lookup.row_entry_name}={lookup.row_entry_value}" for lookup in expected.row_lookup
-        )
+        # Lookup description for log messages, built once per expected result
+        lookup_desc = expected.lookup_desc
 
         if passed:
             log = f"✓ Loop entry '{expected.cif_entry_name}' (where {lookup_desc}) does not match forbidden value '{expected.forbidden_value}'"
@@ -316,13 +317,13 @@ def test_cif_loop_entry_non_match(
             log = f"✗ Loop entry '{expected.cif_entry_name}' (where {lookup_desc}) has forbidden value '{expected.forbidden_value}'"
 
         return IndividualTestResult(
-            test_case_name=generate_test_case_name("loop_non_match", expected.cif_entry_name),
+            test_case_name=test_case_name,
             passed=passed,
             log=log,
         )
     except (ValueMissingError, ValueError, IndexError) as e:
         return IndividualTestResult(
-            test_case_name=generate_test_case_name("loop_non_match", expected.cif_entry_name),
+            test_case_name=test_case_name,
             passed=False,
             log=f"✗ {str(e)}",
         )
@@ -332,28 +333,24 @@ def test_cif_loop_entry_within(
     adapter: CIFIOAdapter, expected: CifLoopEntryWithinExpectedResult
 ) -> IndividualTestResult:
     """Test that a numerical loop entry falls within an acceptable range."""
+    test_case_name = generate_test_case_name("loop_within", expected.cif_entry_name)
     try:
-        # Convert RowLookup models to tuple list
-        row_lookups = [(lookup.row_entry_name, str(lookup.row_entry_value)) for lookup in expected.row_lookup]
-
-        actual_value = adapter.get_loop_entry_from_cif_block(expected.cif_entry_name, row_lookups)
+        actual_value = adapter.get_loop_entry_from_cif_block(expected.cif_entry_name, expected.row_lookup_key)
 
         # Convert to float for numerical comparison
         try:
             actual_float = float(actual_value)
         except (ValueError, TypeError):
             return IndividualTestResult(
-                test_case_name=generate_test_case_name("loop_within", expected.cif_entry_name),
+                test_case_name=test_case_name,
                 passed=False,
                 log=f"✗ Loop entry '{expected.cif_entry_name}' value '{actual_value}' is not a valid number",
             )
 
         passed = expected.min_value <= actual_float <= expected.max_value
 
-        # Build lookup description for log messages
-        lookup_desc = " AND ".join(
-            f"{lookup.row_entry_name}={lookup.row_entry_value}" for lookup in expected.row_lookup
-        )
+        # Lookup description for log messages, built once per expected result
+        lookup_desc = expected.lookup_desc
 
         if passed:
             log = f"✓ Loop entry '{expected.cif_entry_name}' (where {lookup_desc}) value {actual_float} is within [{expected.min_value}, {expected.max_value}]"
@@ -361,13 +358,13 @@ def test_cif_loop_entry_within(
             log = f"✗ Loop entry '{expected.cif_entry_name}' (where {lookup_desc}) value {actual_float} is outside [{expected.min_value}, {expected.max_value}]"
 
         return IndividualTestResult(
-            test_case_name=generate_test_case_name("loop_within", expected.cif_entry_name),
+            test_case_name=test_case_name,
             passed=passed,
             log=log,
         )
     except (ValueMissingError, ValueError, IndexError) as e:
         return IndividualTestResult(
-            test_case_name=generate_test_case_name("loop_within", expected.cif_entry_name),
+            test_case_name=test_case_name,
             passed=False,
             log=f"✗ {str(e)}",
         )
@@ -377,19 +374,15 @@ def test_cif_loop_entry_contain(
     adapter: CIFIOAdapter, expected: CifLoopEntryContainExpectedResult
 ) -> IndividualTestResult:
     """Test that a loop entry (string) contains a specific substring."""
+    test_case_name = generate_test_case_name("loop_contain", expected.cif_entry_name)
     try:
-        # Convert RowLookup models to tuple list
-        row_lookups = [(lookup.row_entry_name, str(lookup.row_entry_value)) for lookup in expected.row_lookup]
-
-        actual_value = adapter.get_loop_entry_from_cif_block(expected.cif_entry_name, row_lookups)
+        actual_value = adapter.get_loop_entry_from_cif_block(expected.cif_entry_name, expected.row_lookup_key)
         actual_str = str(actual_value)
 
         passed = expected.expected_value in actual_str
 
-        # Build lookup description for log messages
-        lookup_desc = " AND ".join(
-            f"{lookup.row_entry_name}={lookup.row_entry_value}" for lookup in expected.row_lookup
-        )
+        # Lookup description for log messages, built once per expected result
+        lookup_desc = expected.lookup_desc
 
         if passed:
             log = f"✓ Loop entry '{expected.cif_entry_name}' (where {lookup_desc}) contains '{expected.expected_value}'"
@@ -397,13 +390,13 @@ def test_cif_loop_entry_contain(
             log = f"✗ Loop entry '{expected.cif_entry_name}' (where {lookup_desc}) does not contain '{expected.expected_value}' (actual: '{actual_str}')"
 
         return IndividualTestResult(
-            test_case_name=generate_test_case_name("loop_contain", expected.cif_entry_name),
+            test_case_name=test_case_name,
             passed=passed,
             log=log,
         )
     except (ValueMissingError, ValueError, IndexError) as e:
         return IndividualTestResult(
-            test_case_name=generate_test_case_name("loop_contain", expected.cif_entry_name),
+            test_case_name=test_case_name,
             passed=False,
             log=f"✗ {str(e)}",
         )
@@ -413,28 +406,26 @@ def test_cif_loop_entry_missing(
     adapter: CIFIOAdapter, expected: CifLoopEntryMissingExpectedResult
 ) -> IndividualTestResult:
     """Test that a specific loop column does NOT exist."""
+    test_case_name = generate_test_case_name("loop_missing", expected.cif_entry_name)
     try:
-        # Convert RowLookup models to tuple list
-        row_lookups = [(lookup.row_entry_name, str(lookup.row_entry_value)) for lookup in expected.row_lookup]
-
-        actual_value = adapter.get_loop_entry_from_cif_block(expected.cif_entry_name, row_lookups)
+        actual_value = adapter.get_loop_entry_from_cif_block(expected.cif_entry_name, expected.row_lookup_key)
         # If we get here, the entry exists, which means the test failed
         return IndividualTestResult(
-            test_case_name=generate_test_case_name("loop_missing", expected.cif_entry_name),
+            test_case_name=test_case_name,
             passed=False,
             log=f"✗ Loop entry '{expected.cif_entry_name}' should be missing but was found with value '{actual_value}'",
         )
     except ValueMissingError:
         # Entry is missing, which is what we expect
         return IndividualTestResult(
-            test_case_name=generate_test_case_name("loop_missing", expected.cif_entry_name),
+            test_case_name=test_case_name,
             passed=True,
             log=f"✓ Loop entry '{expected.cif_entry_name}' is missing as expected",
         )
     except (ValueError, IndexError):
         # Row lookup failed, treat as missing
         return IndividualTestResult(
-            test_case_name=generate_test_case_name("loop_missing", expected.cif_entry_name),
+            test_case_name=test_case_name,
             passed=True,
             log=f"✓ Loop entry '{expected.cif_entry_name}' is missing (lookup failed as expected)",
         )
@@ -444,36 +435,32 @@ def test_cif_loop_entry_present(
     adapter: CIFIOAdapter, expected: CifLoopEntryPresentExpectedResult
 ) -> IndividualTestResult:
     """Test that a loop entry exists in a specific row."""
+    test_case_name = generate_test_case_name("loop_present", expected.cif_entry_name)
     try:
-        # Convert RowLookup models to tuple list
-        row_lookups = [(lookup.row_entry_name, str(lookup.row_entry_value)) for lookup in expected.row_lookup]
-
-        actual_value = adapter.get_loop_entry_from_cif_block(expected.cif_entry_name, row_lookups)
+        actual_value = adapter.get_loop_entry_from_cif_block(expected.cif_entry_name, expected.row_lookup_key)
         actual_str = str(actual_value).strip()
 
         # Check if value is undefined (? or .)
-        is_undefined = actual_str in ("?", ".")
+        is_undefined = actual_str in _UNDEFINED_VALUES
 
-        # Build lookup description for log messages
-        lookup_desc = " AND ".join(
-            f"{lookup.row_entry_name}={lookup.row_entry_value}" for lookup in expected.row_lookup
-        )
+        # Lookup description for log messages, built once per expected result
+        lookup_desc = expected.lookup_desc
 
         if is_undefined and not expected.allow_unknown:
             return IndividualTestResult(
-                test_case_name=generate_test_case_name("loop_present", expected.cif_entry_name),
+                test_case_name=test_case_name,
                 passed=False,
                 log=f"✗ Loop entry '{expected.cif_entry_name}' (where {lookup_desc}) is present but has undefined value '{actual_str}' (allow_unknown=False)",
             )
 
         return IndividualTestResult(
-            test_case_name=generate_test_case_name("loop_present", expected.cif_entry_name),
+            test_case_name=test_case_name,
             passed=True,
             log=f"✓ Loop entry '{expected.cif_entry_name}' (where {lookup_desc}) is present with value '{actual_value}'",
         )
     except (ValueMissingError, ValueError, IndexError) as e:
         return IndividualTestResult(
-            test_case_name=generate_test_case_name("loop_present", expected.cif_entry_name),
+            test_case_name=test_case_name,
             passed=False,
             log=f"✗ {str(e)}",
         )
@@ -510,6 +497,9 @@ def check_result(cif_text: str, expected_result: ExpectedResultType) -> Individu
     """
     Check a CIF output against an expected result specification.
 
+    The CIF text is parsed on every call. To check several expected results
+    against one output, create one adapter and use check_result_on_adapter.
+
     Args:
         cif_text: The CIF file content to test
         expected_result: The expected result specification
@@ -517,9 +507,23 @@ def check_result(cif_text: str, expected_result: ExpectedResultType) -> Individu
     Returns:
         IndividualTestResult with the test outcome
     """
-    # Create adapter for CIF parsing
-    adapter = PyCIFRWAdapter(cif_text)
+    return check_result_on_adapter(make_cif_adapter(cif_text), expected_result)
+
+
+def check_result_on_adapter(adapter: CIFIOAdapter, expected_result: ExpectedResultType) -> IndividualTestResult:
+    """
+    Check an already parsed CIF against an expected result specification.
+
+    Use this to run several expected results against one CIF output with a
+    single adapter, so that its parse and lookup tables are shared.
 
+    Args:
+        adapter: Adapter wrapping the parsed CIF output
+        expected_result: The expected result specification
+
+    Returns:
+        IndividualTestResult with the test outcome
+    """
     # Look up the appropriate test function based on the result type
     test_function = TEST_FUNCTION_MAP.get(type(expected_result))
 
@@ -19,6 +19,7 @@ from qcrbox_cmd_tester.error_formatter import (
     _format_test_case_by_index,
     _format_test_case_context,
     _has_result_type_discriminator,
+    _index_expected_results,
     _is_result_type_discriminator,
     _is_test_type_discriminator,
     format_yaml_error,
@@ -216,6 +217,20 @@ class TestFindResultIndex:
         result = _find_result_index(test_case, "status", None)
         assert result is None
 
+    def test_find_result_index_with_precomputed_index(self):
+        """Test that a precomputed index gives the same answers as a fresh scan."""
+        test_case = {
+            "expected_results": [
+                {"result_type": "cif_value", "test_type": "match"},
+                {"result_type": "cif_value", "test_type": ["not", "hashable"]},
+                {"result_type": "cif_value", "test_type": "within"},
+            ]
+        }
+        results_index = _index_expected_results(test_case)
+        assert _find_result_index(test_case, "cif_value", None, results_index) == 0
+        assert _find_result_index(test_case, "cif_value", "within", results_index) == 2
+        assert _find_result_index(test_case, "status", None, results_index) is None
+
 
 class TestBuildReadableLocation:
     """Test the main location building function."""
@@ -295,6 +310,14 @@ class TestBuildReadableLocation:
         # more in the path like (1, 'expected_results', 0, 'status', 'expected')
         assert "Test case 0:" in result or "expected value 1: status" in result
 
+    def test_build_readable_location_empty(self):
+        """Test that an empty location refers to the document root."""
+        assert _build_readable_location((), {"test_cases": [{"name": "test"}]}) == "<root>"
+
+    def test_build_readable_location_single_field(self):
+        """Test that a single field name is returned as-is."""
+        assert _build_readable_location(("test_cases",), {"test_cases": [{"name": "test"}]}) == "test_cases"
+
 
 class TestFormatYamlError:
     """Test the main format_yaml_error function."""
@@ -340,6 +363,19 @@ class TestFormatYamlError:
 
         assert mock_console.print.call_count == 3
 
+    @patch("qcrbox_cmd_tester.error_formatter.console")
+    def test_format_generic_error_not_a_terminal(self, mock_console):
+        """Test that generic errors are printed as a single plain line when not writing to a terminal."""
+        mock_console.is_terminal = False
+        error = ValueError("Something went wrong")
+        yaml_file = Path("/path/to/test.yaml")
+
+        format_yaml_error(error, yaml_file)
+
+        assert mock_console.print.call_count == 3
+        message = mock_console.print.call_args_list[1].args[0]
+        assert message == "ERROR: Error loading test suite /path/to/test.yaml: Something went wrong"
+
     @patch("qcrbox_cmd_tester.error_formatter.console")
     def test_format_validation_error_single(self, mock_console):
         """Test formatting a single validation error."""
@@ -392,8 +428,10 @@ class TestFormatYamlError:
 
         format_yaml_error(error, yaml_file, yaml_data)
 
-        # Should print multiple error sections
-        assert mock_console.print.call_count >= 8
+        # Both error sections should be printed in a single batched call
+        printed = "\n".join(str(call.args[0]) for call in mock_console.print.call_args_list if call.args)
+        assert "Error 1:" in printed
+        assert "Error 2:" in printed
 
     @patch("qcrbox_cmd_tester.error_formatter.console")
     def test_format_validation_error_with_large_input(self, mock_console):
@@ -1,6 +1,7 @@
 """Tests for the expected_values module."""
 
 import pytest
+from pydantic import ValidationError
 
 from qcrbox_cmd_tester.models.expected_values import (
     CifEntryContainExpectedResult,
@@ -286,3 +287,89 @@ def test_within_missing_required_fields():
 
     with pytest.raises(ValueError, match="requires either"):
         parse_data(data)
+
+
+def test_entry_names_are_interned():
+    """Test that equal entry names from different results share one string object."""
+    first = parse_data(
+        {
+            "result_type": "cif_value",
+            "test_type": "match",
+            "cif_entry_name": "".join(["_cell", "_length_a"]),
+            "expected_value": 1,
+        }
+    )
+    second = parse_data(
+        {
+            "result_type": "cif_loop_value",
+            "test_type": "present",
+            "cif_entry_name": "".join(["_cell_", "length_a"]),
+            "row_lookup": [{"row_entry_name": "".join(["_cell_length", "_a"]), "row_entry_value": 1}],
+        }
+    )
+
+    assert first.cif_entry_name is second.cif_entry_name
+    assert second.row_lookup[0].row_entry_name is first.cif_entry_name
+
+
+def test_loop_row_lookup_key():
+    """Test that loop results precompute their row lookups as (name, str value) pairs."""
+    result = parse_data(
+        {
+            "result_type": "cif_loop_value",
+            "test_type": "match",
+            "cif_entry_name": "_loop.value",
+            "row_lookup": [
+                {"row_entry_name": "_loop.index", "row_entry_value": 2},
+                {"row_entry_name": "_loop.label", "row_entry_value": "C1"},
+            ],
+            "expected_value": 12,
+        }
+    )
+
+    assert result.row_lookup_key == (("_loop.index", "2"), ("_loop.label", "C1"))
+    assert result.lookup_desc == "_loop.index=2 AND _loop.label=C1"
+    assert result.row_lookup_key is result.row_lookup_key
+
+
+def test_loop_row_lookup_is_frozen():
+    """Test that row lookups are immutable and reject unknown keys like the other result models."""
+    result = parse_data(
+        {
+            "result_type": "cif_loop_value",
+            "test_type": "present",
+            "cif_entry_name": "_loop.value",
+            "row_lookup": [{"row_entry_name": "_loop.index", "row_entry_value": 2}],
+        }
+    )
+
+    with pytest.raises(ValidationError):
+        result.row_lookup[0].row_entry_value = 3
+
+    with pytest.raises(ValidationError):
+        parse_data(
+            {
+                "result_type": "cif_loop_value",
+                "test_type": "present",
+                "cif_entry_name": "_loop.value",
+                "row_lookup": [{"row_entry_name": "_loop.index", "row_entry_value": 2, "row_entry_nmae": "x"}],
+            }
+        )
+
+
+def test_match_comparison_strings_are_cached():
+    """Test that match/non-match results precompute their stripped comparison strings."""
+    match = parse_data(
+        {"result_type": "cif_value", "test_type": "match", "cif_entry_name": "_a", "expected_value": " C "}
+    )
+    non_match = parse_data(
+        {"result_type": "cif_value", "test_type": "non-match", "cif_entry_name": "_a", "forbidden_value": 12}
+    )
+
+    assert match.expected_str == "C"
+    assert match.expected_str is match.expected_str
+    assert match.expected_value == " C "
+    assert non_match.forbidden_str == "12"
+    # The cached values are not part of the model data
+    assert match.model_dump()["expected_value"] == " C "
+    assert "expected_str" not in match.model_dump()
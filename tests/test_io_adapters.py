@@ -0,0 +1,152 @@
+"""Tests for the io_adapters module."""
+
+import pytest
+
+from qcrbox_cmd_tester.io_adapters import GemmiAdapter, PyCIFRWAdapter, ValueMissingError, make_cif_adapter
+
+
+@pytest.fixture
+def sample_cif():
+    """Sample CIF text with a single entry and a loop."""
+    return """
+data_example
+_cif.entry1 C
+
+loop_
+_loop_entry.index
+_loop_entry.index_additional
+_loop_entry.value
+1 6 12
+2 7 13
+2 6 18
+"""
+
+
+def test_adapter_from_path(sample_cif, tmp_path):
+    """Test creating an adapter directly from a CIF file on disk."""
+    cif_file = tmp_path / "sample.cif"
+    cif_file.write_text(sample_cif)
+
+    adapter = PyCIFRWAdapter.from_path(cif_file)
+
+    assert adapter.get_entry_from_cif_block("_cif.entry1") == "C"
+    assert adapter.get_loop_entry_from_cif_block("_loop_entry.value", [("_loop_entry.index", "1")]) == "12"
+
+
+def test_get_entry_from_cif_block(sample_cif):
+    """Test reading a single CIF entry."""
+    adapter = PyCIFRWAdapter(sample_cif)
+
+    assert adapter.get_entry_from_cif_block("_cif.entry1") == "C"
+
+
+def test_get_entry_from_cif_block_missing(sample_cif):
+    """Test that a missing entry raises ValueMissingError."""
+    adapter = PyCIFRWAdapter(sample_cif)
+
+    with pytest.raises(ValueMissingError):
+        adapter.get_entry_from_cif_block("_cif.not_there")
+
+
+def test_get_loop_entry_multiple_lookups(sample_cif):
+    """Test that all lookup conditions must match to select a row."""
+    adapter = PyCIFRWAdapter(sample_cif)
+
+    value = adapter.get_loop_entry_from_cif_block(
+        "_loop_entry.value", [("_loop_entry.index", "2"), ("_loop_entry.index_additional", "6")]
+    )
+
+    assert value == "18"
+
+
+def test_get_loop_entry_no_matching_row(sample_cif):
+    """Test that a lookup without a matching row raises ValueError."""
+    adapter = PyCIFRWAdapter(sample_cif)
+
+    with pytest.raises(ValueError, match="No row found"):
+        adapter.get_loop_entry_from_cif_block(
+            "_loop_entry.value", [("_loop_entry.index", "1"), ("_loop_entry.index_additional", "7")]
+        )
+
+
+def test_get_loop_entry_repeated_lookups_on_same_column(sample_cif):
+    """Test that lookups on an already indexed column still find the right rows."""
+    adapter = PyCIFRWAdapter(sample_cif)
+
+    assert adapter.get_loop_entry_from_cif_block("_loop_entry.value", [("_loop_entry.index", "1")]) == "12"
+    assert adapter.get_loop_entry_from_cif_block("_loop_entry.index_additional", [("_loop_entry.index", "1")]) == "6"
+    with pytest.raises(ValueError, match="No row found"):
+        adapter.get_loop_entry_from_cif_block("_loop_entry.value", [("_loop_entry.index", "4")])
+
+
+def test_get_loop_entry_multiple_matching_rows(sample_cif):
+    """Test that an ambiguous lookup reports the number and indexes of the matching rows."""
+    adapter = PyCIFRWAdapter(sample_cif)
+
+    with pytest.raises(ValueError, match=r"More than one row \(2\) found .* Indexes in loop 1 2"):
+        adapter.get_loop_entry_from_cif_block("_loop_entry.value", [("_loop_entry.index", "2")])
+
+
+def test_gemmi_adapter_matches_pycifrw(sample_cif):
+    """Test that the gemmi backend returns the same values as the PyCIFRW backend."""
+    pytest.importorskip("gemmi")
+    cif_text = sample_cif + "_cif.quoted 'C H'\n_cif.unknown ?\n_cif.text\n;\nmulti\nline\n;\n"
+    gemmi_adapter = GemmiAdapter(cif_text)
+    pycifrw_adapter = PyCIFRWAdapter(cif_text)
+
+    for entry_name in ("_cif.entry1", "_cif.quoted", "_cif.unknown", "_cif.text", "_loop_entry.value"):
+        assert gemmi_adapter.get_entry_from_cif_block(entry_name) == pycifrw_adapter.get_entry_from_cif_block(
+            entry_name
+        )
+    lookups = [("_loop_entry.index", "2"), ("_loop_entry.index_additional", "6")]
+    assert gemmi_adapter.get_loop_entry_from_cif_block("_loop_entry.value", lookups) == "18"
+
+
+def test_gemmi_adapter_errors(sample_cif):
+    """Test that the gemmi backend raises the same errors as the PyCIFRW backend."""
+    pytest.importorskip("gemmi")
+    adapter = GemmiAdapter(sample_cif)
+
+    with pytest.raises(ValueMissingError):
+        adapter.get_entry_from_cif_block("_cif.not_there")
+    with pytest.raises(ValueMissingError):
+        adapter.get_loop_entry_from_cif_block("_loop_entry.value", [("_loop_entry.not_there", "1")])
+    with pytest.raises(ValueError, match="No row found"):
+        adapter.get_loop_entry_from_cif_block("_loop_entry.value", [("_loop_entry.index", "4")])
+    with pytest.raises(ValueError, match=r"More than one row \(2\)"):
+        adapter.get_loop_entry_from_cif_block("_loop_entry.value", [("_loop_entry.index", "2")])
+
+
+def test_make_cif_adapter_backend(sample_cif, monkeypatch):
+    """Test that make_cif_adapter picks the backend from QCRBOX_CIF_BACKEND."""
+    monkeypatch.delenv("QCRBOX_CIF_BACKEND", raising=False)
+    assert isinstance(make_cif_adapter(sample_cif), PyCIFRWAdapter)
+
+    monkeypatch.setenv("QCRBOX_CIF_BACKEND", "unknown")
+    with pytest.raises(ValueError, match="Unknown CIF backend"):
+        make_cif_adapter(sample_cif)
+
+
+def test_get_loop_entry_lookup_column_from_other_loop():
+    """Test that a lookup column outside the entry's loop is rejected regardless of call order."""
+    cif_text = """
+data_two_loops
+loop_
+_a.id
+_a.v
+1 10
+2 20
+
+loop_
+_b.id
+_b.w
+1 100
+2 200
+"""
+    adapter = PyCIFRWAdapter(cif_text)
+
+    with pytest.raises(KeyError):
+        adapter.get_loop_entry_from_cif_block("_b.w", [("_a.id", "2")])
+    assert adapter.get_loop_entry_from_cif_block("_a.v", [("_a.id", "2")]) == "20"
+    with pytest.raises(KeyError):
+        adapter.get_loop_entry_from_cif_block("_b.w", [("_a.id", "2")])
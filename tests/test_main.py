@@ -0,0 +1,236 @@
+"""Tests for the command-line runner in __main__."""
+
+import sys
+import threading
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from qcrbox_cmd_tester.__main__ import SuiteRun, load_suite, main, run_loaded_suite, run_test_suites_from_path
+
+SUITE_YAML = """
+application_slug: {slug}
+application_version: 1.0.0
+description: Test suite
+test_cases:
+  - name: test1
+    command_name: process
+    input_parameters: []
+    expected_results:
+      - result_type: cif_value
+        test_type: match
+        cif_entry_name: _atom.type
+        expected_value: C
+"""
+
+
+def write_suite(folder, file_name, slug):
+    """Write a minimal test suite file and return its path."""
+    path = folder / file_name
+    path.write_text(SUITE_YAML.format(slug=slug))
+    return path
+
+
+def passing_run(suite_run, qcrbox_url, *args):
+    """Stand-in for run_loaded_suite that reports an empty, passing result."""
+    if suite_run.error is not None:
+        return suite_run
+    suite_run.result = SimpleNamespace(
+        application_slug=suite_run.test_suite.application_slug, all_passed=True, test_results=[]
+    )
+    return suite_run
+
+
+# Tests for load_suite
+
+
+def test_load_suite(tmp_path):
+    """Test loading a valid suite file."""
+    suite_run = load_suite(write_suite(tmp_path, "suite.yaml", "app"))
+
+    assert suite_run.error is None
+    assert suite_run.yaml_data["application_slug"] == "app"
+    assert suite_run.test_suite.application_slug == "app"
+
+
+def test_load_suite_invalid_yaml(tmp_path):
+    """Test that YAML syntax errors are stored on the suite run instead of raised."""
+    yaml_file = tmp_path / "broken.yaml"
+    yaml_file.write_text("application_slug: [unclosed\n")
+
+    suite_run = load_suite(yaml_file)
+
+    assert suite_run.error is not None
+    assert suite_run.test_suite is None
+
+
+# Tests for run_loaded_suite
+
+
+def test_run_loaded_suite_skips_failed_load(tmp_path):
+    """Test that a suite that failed to load is returned unchanged."""
+    error = ValueError("invalid")
+    suite_run = SuiteRun(yaml_file=tmp_path / "suite.yaml", error=error)
+
+    assert run_loaded_suite(suite_run, "http://localhost") is suite_run
+    assert suite_run.error is error
+    assert suite_run.result is None
+
+
+def test_run_loaded_suite(tmp_path):
+    """Test that a loaded suite is run with a client for the given URL."""
+    pytest.importorskip("qcrboxapiclient")
+    suite_run = load_suite(write_suite(tmp_path, "suite.yaml", "app"))
+
+    with (
+        patch("qcrboxapiclient.client.Client") as mock_client_class,
+        patch("qcrbox_cmd_tester.run_suite.run_test_suite") as mock_run_suite,
+    ):
+        run_loaded_suite(suite_run, "http://qcrbox", fail_fast=True)
+
+    assert mock_client_class.call_args.args == ("http://qcrbox",)
+    client = mock_client_class.return_value.__enter__.return_value
+    mock_run_suite.assert_called_once_with(client, suite_run.test_suite, max_workers=4, fail_fast=True)
+    assert suite_run.result is mock_run_suite.return_value
+    assert suite_run.error is None
+
+
+def test_run_loaded_suite_records_error(tmp_path):
+    """Test that errors raised while running are stored on the suite run."""
+    pytest.importorskip("qcrboxapiclient")
+    suite_run = load_suite(write_suite(tmp_path, "suite.yaml", "app"))
+
+    with (
+        patch("qcrboxapiclient.client.Client"),
+        patch("qcrbox_cmd_tester.run_suite.run_test_suite", side_effect=RuntimeError("connection refused")),
+    ):
+        run_loaded_suite(suite_run, "http://qcrbox")
+
+    assert isinstance(suite_run.error, RuntimeError)
+    assert suite_run.result is None
+
+
+# Tests for run_test_suites_from_path
+
+
+def test_run_test_suites_single_job_reports_in_name_order(tmp_path, capsys):
+    """Test that with one job every suite runs and the report is in file name order."""
+    for file_name, slug in (("c.yaml", "third"), ("a.yaml", "first"), ("b.yml", "second")):
+        write_suite(tmp_path, file_name, slug)
+    ran = []
+
+    def record_run(suite_run, qcrbox_url, *args):
+        ran.append(suite_run.yaml_file.name)
+        return passing_run(suite_run, qcrbox_url)
+
+    with patch("qcrbox_cmd_tester.__main__.run_loaded_suite", side_effect=record_run):
+        all_passed = run_test_suites_from_path(tmp_path, "http://qcrbox", jobs=1)
+
+    output = capsys.readouterr().out
+    assert all_passed is True
+    assert sorted(ran) == ["a.yaml", "b.yml", "c.yaml"]
+    reported = [line.split(": ", 1)[1] for line in output.splitlines() if line.startswith("Loading test suite from:")]
+    assert reported == ["a.yaml", "b.yml", "c.yaml"]
+
+
+def test_run_test_suites_discovers_suites_by_exact_suffix(tmp_path):
+    """Test that suite discovery matches the suffixes exactly and keeps symlinked suite files."""
+    write_suite(tmp_path, "a.yaml", "first")
+    write_suite(tmp_path, "upper.YAML", "ignored")
+    (tmp_path / "link.yml").symlink_to(tmp_path / "a.yaml")
+    ran = []
+
+    def record_run(suite_run, qcrbox_url, *args):
+        ran.append(suite_run.yaml_file.name)
+        return passing_run(suite_run, qcrbox_url)
+
+    with patch("qcrbox_cmd_tester.__main__.run_loaded_suite", side_effect=record_run):
+        run_test_suites_from_path(tmp_path, "http://qcrbox", jobs=1)
+
+    assert sorted(ran) == ["a.yaml", "link.yml"]
+
+
+def test_run_test_suites_reports_each_suite(tmp_path, capsys):
+    """Test that every suite is reported and load errors fail the run."""
+    write_suite(tmp_path, "good.yaml", "good_app")
+    (tmp_path / "bad.yaml").write_text("application_slug: [unclosed\n")
+
+    with patch("qcrbox_cmd_tester.__main__.run_loaded_suite", side_effect=passing_run):
+        all_passed = run_test_suites_from_path(tmp_path, "http://qcrbox", jobs=2)
+
+    output = capsys.readouterr().out
+    assert all_passed is False
+    assert "Loading test suite from: good.yaml" in output
+    assert "Loading test suite from: bad.yaml" in output
+    assert "Test Suites: 1/1 passed" in output
+
+
+def test_run_test_suites_reports_in_name_order(tmp_path, capsys):
+    """Test that suites are reported in file name order, not in the order they finish."""
+    write_suite(tmp_path, "a.yaml", "slow")
+    write_suite(tmp_path, "b.yaml", "fast")
+    fast_finished = threading.Event()
+
+    def run(suite_run, qcrbox_url, *args):
+        if suite_run.test_suite.application_slug == "slow":
+            fast_finished.wait(timeout=10)
+        else:
+            fast_finished.set()
+        return passing_run(suite_run, qcrbox_url)
+
+    with patch("qcrbox_cmd_tester.__main__.run_loaded_suite", side_effect=run):
+        run_test_suites_from_path(tmp_path, "http://qcrbox", jobs=2)
+
+    output = capsys.readouterr().out
+    assert output.index("Loading test suite from: a.yaml") < output.index("Loading test suite from: b.yaml")
+
+
+def test_run_test_suites_interrupt_does_not_wait_for_running_suites(tmp_path):
+    """Test that an interrupt is raised without waiting for suites that are still running."""
+    write_suite(tmp_path, "a.yaml", "interrupted")
+    write_suite(tmp_path, "b.yaml", "still_running")
+    release = threading.Event()
+
+    def run(suite_run, qcrbox_url, *args):
+        if suite_run.test_suite.application_slug == "interrupted":
+            raise KeyboardInterrupt
+        release.wait(timeout=10)
+        return passing_run(suite_run, qcrbox_url)
+
+    try:
+        with patch("qcrbox_cmd_tester.__main__.run_loaded_suite", side_effect=run):
+            with pytest.raises(KeyboardInterrupt):
+                run_test_suites_from_path(tmp_path, "http://qcrbox", jobs=2)
+        # The second suite is still blocked, so the runner did not wait for it
+        assert not release.is_set()
+    finally:
+        release.set()
+        # The interrupt cancels QCrBox commands process wide, allow later tests to run them again
+        qcrbox_client = sys.modules.get("qcrbox_cmd_tester.qcrbox_client")
+        if qcrbox_client is not None:
+            qcrbox_client.reset_cancellation()
+
+
+# Tests for main
+
+
+def test_main_missing_location(tmp_path, monkeypatch, capsys):
+    """Test that a location that does not exist is reported as missing."""
+    monkeypatch.setattr(sys, "argv", ["qcrbox-test", "--test-location", str(tmp_path / "missing")])
+
+    assert main() == 1
+    assert "does not exist" in capsys.readouterr().err
+
+
+def test_main_inaccessible_location(tmp_path, monkeypatch, capsys):
+    """Test that a location that exists but cannot be accessed is not reported as missing."""
+    monkeypatch.setattr(sys, "argv", ["qcrbox-test", "--test-location", str(tmp_path)])
+
+    with patch("pathlib.Path.stat", side_effect=PermissionError(13, "Permission denied")):
+        assert main() == 1
+
+    error = capsys.readouterr().err
+    assert "Cannot access" in error
+    assert "Permission denied" in error
+    assert "does not exist" not in error
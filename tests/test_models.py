@@ -4,6 +4,7 @@ import tempfile
 from pathlib import Path
 
 import pytest
+from pydantic import ValidationError
 
 from qcrbox_cmd_tester.models import (
     QCrBoxFileParameter,
@@ -104,6 +105,16 @@ def test_file_parameter_from_external_file():
         temp_file.unlink()
 
 
+def test_file_parameter_from_external_file_normalizes_line_endings(tmp_path):
+    """Test that Windows line endings in external files are read as plain newlines."""
+    cif_file = tmp_path / "crlf.cif"
+    cif_file.write_bytes(b"data_external\r\n_value 42\r\n_label \xc3\x85\r")
+
+    param = QCrBoxFileParameter.from_external_file(cif_file, "external_param", base_folder=tmp_path)
+
+    assert param.cif_content == "data_external\n_value 42\n_label \u00c5\n"
+
+
 def test_file_parameter_upload_filename_default():
     """Test that upload_filename defaults to None."""
     content = "data_test\n"
@@ -231,6 +242,35 @@ def test_test_case_duplicate_parameter_names():
         )
 
 
+def test_test_case_from_yaml_dict_matches_validated_model():
+    """Test that TestCase.from_yaml_dict builds the same model as full validation."""
+    data = {
+        "name": "test1",
+        "command_name": "cmd",
+        "input_parameters": [{"name": "param1", "value": 1}],
+        "expected_results": [{"result_type": "status", "expected": "successful"}],
+    }
+
+    test_case = TestCase.from_yaml_dict(data, "app", "1.0", base_folder=Path("."))
+
+    assert test_case == TestCase.model_validate(test_case.model_dump())
+    assert test_case.model_fields_set == set(TestCase.model_fields)
+
+
+def test_test_case_from_yaml_dict_invalid_name():
+    """Test that TestCase.from_yaml_dict still reports invalid fields as validation errors."""
+    data = {
+        "name": "",
+        "command_name": "cmd",
+        "expected_results": [{"result_type": "status", "expected": "successful"}],
+    }
+
+    with pytest.raises(ValidationError) as exc_info:
+        TestCase.from_yaml_dict(data, "app", "1.0", base_folder=Path("."))
+
+    assert exc_info.value.errors()[0]["loc"] == ("name",)
+
+
 # Tests for TestSuite
 
 
@@ -266,6 +306,59 @@ test_cases:
         temp_file.unlink()
 
 
+def test_test_suite_from_yaml_dict_reads_external_files(tmp_path):
+    """Test that all external files of a suite are loaded, including missing ones raising as before."""
+    (tmp_path / "first.cif").write_text("data_first")
+    (tmp_path / "second.cif").write_text("data_second")
+
+    def suite_data(*file_names):
+        return {
+            "application_slug": "app",
+            "application_version": "1.0",
+            "test_cases": [
+                {
+                    "name": f"test{i}",
+                    "command_name": "cmd",
+                    "input_parameters": [{"name": "cif", "value": file_name, "type": "external_file"}],
+                    "expected_results": [{"result_type": "status", "expected": "successful"}],
+                }
+                for i, file_name in enumerate(file_names)
+            ],
+        }
+
+    suite = TestSuite.from_yaml_dict(suite_data("first.cif", "second.cif", "first.cif"), base_folder=tmp_path)
+
+    contents = [test.qcrbox_command_parameters[0].cif_content for test in suite.tests]
+    assert contents == ["data_first", "data_second", "data_first"]
+
+    with pytest.raises(FileNotFoundError):
+        TestSuite.from_yaml_dict(suite_data("first.cif", "missing.cif"), base_folder=tmp_path)
+
+
+def test_test_suite_from_yaml_dict_missing_file_shows_path_as_written(tmp_path):
+    """Test that a missing external file is reported by its unresolved path."""
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "first.cif").write_text("data_first")
+    data = {
+        "application_slug": "app",
+        "application_version": "1.0",
+        "test_cases": [
+            {
+                "name": f"test{i}",
+                "command_name": "cmd",
+                "input_parameters": [{"name": "cif", "value": f"../{file_name}", "type": "external_file"}],
+                "expected_results": [{"result_type": "status", "expected": "successful"}],
+            }
+            for i, file_name in enumerate(("first.cif", "missing.cif"))
+        ],
+    }
+
+    with pytest.raises(FileNotFoundError) as exc_info:
+        TestSuite.from_yaml_dict(data, base_folder=tmp_path / "sub")
+
+    assert exc_info.value.filename == str(tmp_path / "sub" / ".." / "missing.cif")
+
+
 def test_test_suite_must_have_tests():
     """Test that TestSuite must have at least one test."""
     with pytest.raises(ValueError, match="at least one test"):
@@ -351,3 +444,24 @@ def test_test_suite_to_json_file():
         assert len(data["tests"]) == 1
     finally:
         temp_file.unlink()
+
+
+def test_test_suite_to_json_file_without_orjson(tmp_path, monkeypatch):
+    """Test that the fallback without orjson writes the same JSON."""
+    import qcrbox_cmd_tester.models as models
+
+    test_case = TestCase(
+        name="test1",
+        qcrbox_application_slug="app",
+        qcrbox_application_version="1.0",
+        qcrbox_command_name="cmd",
+        qcrbox_command_parameters=[QCrBoxParameter(name="param1", value=1.5)],
+        expected_results=[CifEntryMatchExpectedResult(cif_entry_name="_test", expected_value="test")],
+    )
+    suite = TestSuite(application_slug="app", application_version="1.0", tests=[test_case])
+
+    suite.to_json_file(str(tmp_path / "default.json"))
+    monkeypatch.setattr(models, "orjson", None)
+    suite.to_json_file(str(tmp_path / "fallback.json"))
+
+    assert (tmp_path / "default.json").read_text() == (tmp_path / "fallback.json").read_text()
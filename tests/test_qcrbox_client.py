@@ -0,0 +1,30 @@
+"""Tests for the qcrbox_client module."""
+
+from unittest.mock import ANY, Mock, patch
+
+import pytest
+
+from qcrbox_cmd_tester import qcrbox_client
+
+# Tests for run_qcrbox_command
+
+
+@patch("qcrbox_cmd_tester.qcrbox_client.delete_datasets", side_effect=RuntimeError("delete failed"))
+@patch("qcrbox_cmd_tester.qcrbox_client.download_dataset_by_id")
+@patch("qcrbox_cmd_tester.qcrbox_client.get_calculation_by_id")
+@patch("qcrbox_cmd_tester.qcrbox_client.invoke_command")
+@patch("qcrbox_cmd_tester.qcrbox_client.InvokeCommandParameters")
+@patch("qcrbox_cmd_tester.qcrbox_client.InvokeCommandParametersCommandArguments")
+@patch("qcrbox_cmd_tester.qcrbox_client.prepare_qcrbox_parameters", return_value=({}, ["input_id"]))
+def test_run_qcrbox_command_keeps_download_error(
+    mock_prepare, mock_arguments, mock_parameters, mock_invoke, mock_get_calculation, mock_download, mock_delete
+):
+    """Test that a failing cleanup does not replace the error raised by the download."""
+    calculation = Mock(status="successful", output_dataset_id="output_id")
+    mock_get_calculation.sync.return_value.payload.calculations = [calculation]
+    mock_download.sync.side_effect = ConnectionError("download failed")
+
+    with pytest.raises(ConnectionError, match="download failed"):
+        qcrbox_client.run_qcrbox_command(Mock(), "process", "test_app", "1.0.0", [])
+
+    mock_delete.assert_called_once_with(ANY, ["input_id", "output_id"])
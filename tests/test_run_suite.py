@@ -1,10 +1,13 @@
 """Tests for the run_suite module."""
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch
 
 import pytest
 from CifFile.StarFile import StarError
 
+from qcrbox_cmd_tester import qcrbox_client
 from qcrbox_cmd_tester.models import (
     QCrBoxFileParameter,
     QCrBoxParameter,
@@ -15,7 +18,7 @@ from qcrbox_cmd_tester.models.expected_values import (
     CifEntryMatchExpectedResult,
     CifEntryPresentExpectedResult,
 )
-from qcrbox_cmd_tester.qcrbox_client import CommandRunResult
+from qcrbox_cmd_tester.qcrbox_client import CommandCancelledError, CommandRunResult
 from qcrbox_cmd_tester.run_suite import (
     TestCaseResult,
     TestSuiteResult,
@@ -344,11 +347,12 @@ def test_run_test_suite_all_pass(mock_run_command, mock_client, test_suite_multi
 @patch("qcrbox_cmd_tester.run_suite.run_qcrbox_command")
 def test_run_test_suite_one_failure(mock_run_command, mock_client, test_suite_multiple):
     """Test a test suite where one test case fails."""
-    # First call succeeds, second fails
-    mock_run_command.side_effect = [
-        CommandRunResult(status="successful", result_cif="data_example\n_atom.type C\n", status_events=[]),
-        CommandRunResult(status="failed", result_cif=None, status_events=["Error"]),
-    ]
+    # First test case succeeds, second fails; keyed by command as the cases may run concurrently
+    command_results = {
+        "cmd1": CommandRunResult(status="successful", result_cif="data_example\n_atom.type C\n", status_events=[]),
+        "cmd2": CommandRunResult(status="failed", result_cif=None, status_events=["Error"]),
+    }
+    mock_run_command.side_effect = lambda client, command_name, *args: command_results[command_name]
 
     result = run_test_suite(mock_client, test_suite_multiple)
 
@@ -370,6 +374,114 @@ def test_run_test_suite_all_fail(mock_run_command, mock_client, test_suite_multi
     assert all(not tc.all_passed for tc in result.test_results)
 
 
+@patch("qcrbox_cmd_tester.run_suite.run_qcrbox_command")
+def test_run_test_suite_sequential(mock_run_command, mock_client, test_suite_multiple, sample_cif_output):
+    """Test that max_workers=1 runs the test cases one after another in order."""
+    mock_run_command.return_value = CommandRunResult(
+        status="successful", result_cif=sample_cif_output, status_events=[]
+    )
+
+    result = run_test_suite(mock_client, test_suite_multiple, max_workers=1)
+
+    assert [call.args[1] for call in mock_run_command.call_args_list] == ["cmd1", "cmd2"]
+    assert [r.test_case_name for r in result.test_results] == ["test_1", "test_2"]
+
+
+@patch("qcrbox_cmd_tester.run_suite.run_qcrbox_command")
+def test_run_test_suite_fail_fast(mock_run_command, mock_client, test_suite_multiple):
+    """Test that fail_fast stops at the first failing test case and skips the rest."""
+    mock_run_command.return_value = CommandRunResult(status="failed", result_cif=None, status_events=[])
+
+    result = run_test_suite(mock_client, test_suite_multiple, max_workers=1, fail_fast=True)
+
+    assert mock_run_command.call_count == 1
+    assert result.all_passed is False
+    assert result.test_results[0].test_case_name == "test_1"
+    assert result.test_results[1].test_case_name == "test_2"
+    assert result.test_results[1].command_status == "skipped"
+    assert result.test_results[1].individual_results == []
+
+
+@patch("qcrbox_cmd_tester.run_suite.run_qcrbox_command")
+def test_run_test_suite_interrupt_cancels_running_cases(mock_run_command, mock_client, test_suite_multiple):
+    """Test that an interrupt cancels the other running test cases instead of waiting for them."""
+
+    second_started = threading.Event()
+
+    def run_command(client, command_name, *args):
+        if command_name == "cmd1":
+            second_started.wait(timeout=10)
+            raise KeyboardInterrupt
+        second_started.set()
+        # Stands in for a command polling QCrBox until it is cancelled
+        if not qcrbox_client._cancel_event.wait(timeout=10):
+            raise AssertionError("running command was not cancelled")
+        raise CommandCancelledError(command_name)
+
+    mock_run_command.side_effect = run_command
+
+    with pytest.raises(KeyboardInterrupt):
+        run_test_suite(mock_client, test_suite_multiple, max_workers=2)
+
+    assert mock_run_command.call_count == 2
+    # Cancellation is reset once the cancelled cases have cleaned up
+    assert not qcrbox_client._cancel_event.is_set()
+
+
+@patch("qcrbox_cmd_tester.run_suite.run_qcrbox_command")
+def test_run_test_suite_error_drops_queued_cases(mock_run_command, mock_client):
+    """Test that an error in one test case stops the test cases that are still queued."""
+    tests = [
+        TestCase(
+            name=f"test_{index}",
+            qcrbox_application_slug="test_app",
+            qcrbox_application_version="1.0.0",
+            qcrbox_command_name=f"cmd{index}",
+            qcrbox_command_parameters=[],
+            expected_results=[CifEntryMatchExpectedResult(cif_entry_name="_atom.type", expected_value="C")],
+        )
+        for index in range(5)
+    ]
+    test_suite = TestSuite(application_slug="test_app", application_version="1.0.0", tests=tests)
+    second_started = threading.Event()
+    shut_down = threading.Event()
+    ran = []
+    executors = []
+
+    class ShutdownSignallingExecutor(ThreadPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            executors.append(self)
+
+        def shutdown(self, wait=True, *, cancel_futures=False):
+            # Let the running cases finish only once the queued ones have been cancelled
+            super().shutdown(wait=False, cancel_futures=cancel_futures)
+            shut_down.set()
+            super().shutdown(wait=wait)
+
+    def run_command(client, command_name, *args):
+        ran.append(command_name)
+        if command_name == "cmd0":
+            second_started.wait(timeout=10)
+            raise RuntimeError("invoke failed")
+        second_started.set()
+        shut_down.wait(timeout=10)
+        return CommandRunResult(status="failed", result_cif=None, status_events=[])
+
+    mock_run_command.side_effect = run_command
+
+    with patch("qcrbox_cmd_tester.run_suite.ThreadPoolExecutor", ShutdownSignallingExecutor):
+        with pytest.raises(RuntimeError, match="invoke failed"):
+            run_test_suite(mock_client, test_suite, max_workers=2)
+    # Run whatever is still queued, so that test cases left behind by the error show up
+    shut_down.set()
+    executors[0].shutdown(wait=True)
+
+    # The worker freed by the error may pick up one more case before the queue is cancelled
+    assert "cmd1" in ran
+    assert not {"cmd3", "cmd4"} & set(ran)
+
+
 # Tests for dataclass structures
 
 
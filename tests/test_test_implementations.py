@@ -1,7 +1,10 @@
 """Tests for the test_implementations module."""
 
+import dataclasses
+
 import pytest
 
+from qcrbox_cmd_tester.io_adapters import PyCIFRWAdapter
 from qcrbox_cmd_tester.models.expected_values import (
     CifEntryContainExpectedResult,
     CifEntryMatchExpectedResult,
@@ -21,6 +24,7 @@ from qcrbox_cmd_tester.test_implementations import (
     TEST_FUNCTION_MAP,
     IndividualTestResult,
     check_result,
+    check_result_on_adapter,
     generate_test_case_name,
 )
 
@@ -62,6 +66,21 @@ def test_match_success(sample_cif):
     assert "match" in result.log.lower()
 
 
+def test_check_result_on_shared_adapter(sample_cif):
+    """Test checking several expected results against one parsed CIF."""
+    adapter = PyCIFRWAdapter(sample_cif)
+
+    match = check_result_on_adapter(
+        adapter, CifEntryMatchExpectedResult(cif_entry_name="_cif.entry1", expected_value="C")
+    )
+    mismatch = check_result_on_adapter(
+        adapter, CifEntryMatchExpectedResult(cif_entry_name="_cif.entry1", expected_value="D")
+    )
+
+    assert match.passed is True
+    assert mismatch.passed is False
+
+
 def test_match_failure(sample_cif):
     """Test failed match of CIF entry value."""
     expected = CifEntryMatchExpectedResult(cif_entry_name="_cif.entry1", expected_value="D")
@@ -609,3 +628,12 @@ def test_multi_row_lookup_wrong_value(sample_cif):
 
     assert result.passed is False
     assert "expected '99', got '13'" in result.log
+
+
+def test_individual_test_result_is_frozen():
+    """Test that individual results are immutable slotted records."""
+    result = IndividualTestResult(test_case_name="test1", passed=True, log="Success")
+
+    assert not hasattr(result, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        result.passed = False